@@ -4,10 +4,11 @@ AI Router: Endpoints for AI services and orchestration.
 Handles transcription, concept extraction, image analysis, and intelligent orchestration.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 import os
+import orjson
 
 from app.core.database import get_database
 from app.core.security import verify_access_token, verify_auth
@@ -165,7 +166,11 @@ async def orchestrate(
         
         logger.info("[AI Orchestrate] ✓ Orchestration successful")
         logger.info("=" * 60)
-        return result
+        
+        # Encode once with orjson (datetimes natively; default=str covers the
+        # ObjectId insert_one adds to saved curations) instead of response_model
+        # validation + jsonable_encoder
+        return Response(content=orjson.dumps(result, default=str), media_type="application/json")
     
     except ValueError as e:
         logger.error(f"[AI Orchestrate] ✗ ValueError: {str(e)}")
@@ -72,9 +72,8 @@ def generate_state(state_data: str) -> str:
     }
     
     # Use API secret key as JWT secret
-    from app.core.security import get_api_secret_key
-    secret_key = get_api_secret_key()
-    state = jwt.encode(payload, secret_key, algorithm=ALGORITHM)
+    from app.core.security import get_jwt_key
+    state = jwt.encode(payload, get_jwt_key(), algorithm=ALGORITHM)
     
     logger.info(f"[OAuth] Generated stateless state (expires: {expires})")
     return state
@@ -90,11 +89,10 @@ def verify_state(state: str) -> Optional[str]:
     Returns:
         str: code_verifier data if valid, None if invalid/expired
     """
-    from app.core.security import ALGORITHM, get_api_secret_key, JWTError
+    from app.core.security import ALGORITHM, get_jwt_key, JWTError
     
     try:
-        secret_key = get_api_secret_key()
-        payload = jwt.decode(state, secret_key, algorithms=[ALGORITHM])
+        payload = jwt.decode(state, get_jwt_key(), algorithms=[ALGORITHM])
         
         # Verify it's an OAuth state token
         if payload.get("type") != "oauth_state":
@@ -114,8 +112,7 @@ def get_user_by_google_id(db: Database, google_id: str) -> Optional[UserInDB]:
     """Get user from database by Google ID"""
     user_doc = db.users.find_one({"google_id": google_id})
     if user_doc:
-        user_doc["_id"] = str(user_doc["_id"])
-        return UserInDB(**user_doc)
+        return UserInDB.from_db(user_doc)
     return None
 
 
@@ -123,8 +120,7 @@ def get_user_by_email(db: Database, email: str) -> Optional[UserInDB]:
     """Get user from database by email"""
     user_doc = db.users.find_one({"email": email})
     if user_doc:
-        user_doc["_id"] = str(user_doc["_id"])
-        return UserInDB(**user_doc)
+        return UserInDB.from_db(user_doc)
     return None
 
 
@@ -187,7 +183,7 @@ def create_or_update_user(db: Database, user_data: dict) -> UserInDB:
 
         auth_status = "True (Auto-authorized, admin)" if is_lotier else "False (curator)"
         logger.info(f"[OAuth] Created new user: {new_user.email} (authorized={auth_status})")
-        return UserInDB(**user_dict)
+        return UserInDB.from_db(user_dict)
 
 
 @router.get("/google")
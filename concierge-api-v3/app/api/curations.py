@@ -3,22 +3,24 @@ Curation endpoints - CRUD operations for curations
 Professional FastAPI implementation with async MongoDB
 """
 
-from fastapi import APIRouter, HTTPException, Header, Query, Depends, Request, status
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Header, Query, Depends, Request, Response, status
+from typing import Optional, List, Tuple
+import heapq
 import re
 from datetime import datetime, timezone
 from pymongo.errors import DuplicateKeyError
 import time
 import os
+from operator import attrgetter, itemgetter
 import numpy as np
 
 from app.models.schemas import (
-    Curation, CurationCreate, CurationUpdate, PaginatedResponse, CurationStatus,
-    SemanticSearchRequest, SemanticSearchResponse, SemanticSearchResult, ConceptMatch,
-    HybridSearchRequest, HybridSearchResponse, HybridSearchResult,
+    Curation, CurationCreate, CurationUpdate, PaginatedResponse, CurationStatus, CURATION_LIST_ADAPTER,
+    SemanticSearchRequest, SemanticSearchResponse, ConceptMatch,
+    HybridSearchRequest, HybridSearchResponse,
     BulkCurationCreate, BulkOperationResponse, BulkItemError
 )
-from app.core.database import get_database
+from app.core.database import get_database, wait_for_indexes
 from app.core.security import verify_access_token, verify_auth
 from app.models.user import has_role
 from app.services.curation_denorm import denormalize_curation_location
@@ -49,6 +51,54 @@ def build_curation_response_payload(curation_doc: dict) -> dict:
     }
 
 
+def score_concepts(
+    embeddings: list,
+    query_vector: np.ndarray,
+    query_norm: float,
+    allowed_categories: Optional[set] = None
+) -> Tuple[list, np.ndarray]:
+    """
+    Cosine similarity of a curation's concept vectors to the query.
+    
+    The stored list-of-dicts is packed into one [N, D] float32 matrix so all
+    similarities come from a single matrix-vector product.
+    
+    Args:
+        embeddings: Curation embeddings ({"vector", "text", "category", "concept"})
+        query_vector: Query embedding
+        query_norm: Norm of query_vector (non-zero)
+        allowed_categories: Only score concepts in these categories
+        
+    Returns:
+        (concepts, similarities) for concepts with a usable non-zero vector
+    """
+    dimensions = query_vector.shape[0]
+    concepts = []
+    vectors = []
+    
+    for emb in embeddings:
+        if allowed_categories and emb.get("category") not in allowed_categories:
+            continue
+        vector = emb.get("vector")
+        if isinstance(vector, (list, tuple)) and len(vector) == dimensions:
+            concepts.append(emb)
+            vectors.append(vector)
+    
+    if not vectors:
+        return [], np.empty(0, dtype=np.float32)
+    
+    try:
+        matrix = np.asarray(vectors, dtype=np.float32)
+    except (TypeError, ValueError):
+        return [], np.empty(0, dtype=np.float32)
+    
+    norms = np.linalg.norm(matrix, axis=1)
+    keep = np.flatnonzero(norms)
+    similarities = (matrix[keep] @ query_vector) / (norms[keep] * query_norm)
+    
+    return [concepts[i] for i in keep], similarities
+
+
 @router.post("", response_model=Curation, status_code=201)
 def create_curation(
     curation: CurationCreate,
@@ -73,8 +123,9 @@ def create_curation(
     if curation.entity_id and entity:
         doc.update(denormalize_curation_location(entity))
     doc["_id"] = curation.curation_id
-    doc["createdAt"] = datetime.now(timezone.utc)
-    doc["updatedAt"] = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    doc["createdAt"] = now
+    doc["updatedAt"] = now
     doc["version"] = 1
     doc["createdBy"] = curation.createdBy or curation.curator_id
     doc["updatedBy"] = curation.curator_id
@@ -90,7 +141,7 @@ def create_curation(
     
     # Return created curation
     result = db.curations.find_one({"_id": curation.curation_id}, CURATION_RESPONSE_PROJECTION)
-    return Curation(**result)
+    return result
 
 
 @router.get("/search", response_model=PaginatedResponse)
@@ -155,17 +206,17 @@ def search_curations(
         total = db.curations.count_documents(query)
         cursor = db.curations.find(query, CURATION_RESPONSE_PROJECTION).sort("_id", 1).skip(offset).limit(limit)
 
-    items = []
-    for doc in cursor:
-        items.append(Curation(**doc))
-
-    return PaginatedResponse(
-        items=items,
+    page = PaginatedResponse(
+        items=CURATION_LIST_ADAPTER.validate_python(list(cursor)),
         total=total,
         limit=limit,
         offset=offset
     )
 
+    # Items were validated once by the adapter; serialize directly instead of
+    # letting response_model (kept for the OpenAPI schema) check the page again
+    return Response(content=page.model_dump_json(by_alias=True), media_type="application/json")
+
 
 @router.get("/cities")
 def list_cities(db: Database = Depends(get_database)):
@@ -196,11 +247,8 @@ def get_entity_curations(
         "entity_id": entity_id,
         "status": {"$ne": "deleted"}
     }, projection).limit(200)
-    curations = []
-    for doc in cursor:
-        curations.append(Curation(**doc))
-    
-    return curations
+    items = CURATION_LIST_ADAPTER.validate_python(list(cursor))
+    return Response(content=CURATION_LIST_ADAPTER.dump_json(items, by_alias=True), media_type="application/json")
 
 
 @router.get("/{curation_id}", response_model=Curation)
@@ -217,7 +265,7 @@ def get_curation(
             detail=f"Curation {curation_id} not found"
         )
     
-    return Curation(**result)
+    return result
 
 
 @router.patch("/{curation_id}", response_model=Curation)
@@ -308,7 +356,7 @@ def update_curation(
             detail="Version conflict or curation not found"
         )
     
-    return Curation(**result)
+    return result
 
 
 @router.delete("/{curation_id}", status_code=204)
@@ -435,24 +483,10 @@ def semantic_search_curations(
         max_similarity = 0.0
         match_count = 0
         
-        for emb in embeddings:
-            # Filter by category if specified
-            if allowed_categories and emb.get("category") not in allowed_categories:
-                continue
-            
-            # Calculate cosine similarity
-            try:
-                concept_vector = np.asarray(emb["vector"], dtype=np.float32)
-                concept_norm = float(np.linalg.norm(concept_vector))
-                if concept_norm == 0.0:
-                    continue
-                similarity = float(
-                    np.dot(query_vector, concept_vector) / 
-                    (query_norm * concept_norm)
-                )
-            except Exception:
-                continue
-            
+        # Cosine similarity of every concept (filtered by category) at once
+        concepts, similarities = score_concepts(embeddings, query_vector, query_norm, allowed_categories)
+        
+        for emb, similarity in zip(concepts, similarities.tolist()):
             # Filter by threshold
             if similarity >= request.min_similarity:
                 rounded_similarity = round(similarity, 4)
@@ -470,8 +504,8 @@ def semantic_search_curations(
         if not matches:
             continue
         
-        # Sort matches by similarity (descending)
-        matches.sort(key=lambda x: x["similarity"], reverse=True)
+        # Keep the top 10 matches by similarity (descending)
+        top_matches = heapq.nlargest(10, matches, key=itemgetter("similarity"))
         avg_similarity = similarity_sum / match_count
         
         entity_id = curation.get("entity_id")
@@ -482,7 +516,7 @@ def semantic_search_curations(
         result_data = {
             "entity_id": entity_id,
             "curation": build_curation_response_payload(curation),
-            "matches": matches[:10],  # Top 10 matches
+            "matches": top_matches,
             "avg_similarity": round(avg_similarity, 4),
             "max_similarity": round(max_similarity, 4),
             "match_count": match_count
@@ -490,11 +524,8 @@ def semantic_search_curations(
         
         results.append(result_data)
     
-    # 5. Sort by max_similarity (best match first)
-    results.sort(key=lambda x: x["max_similarity"], reverse=True)
-    
-    # 6. Limit results
-    results = results[:request.limit]
+    # 5-6. Keep the best request.limit results by max_similarity (best match first)
+    results = heapq.nlargest(request.limit, results, key=itemgetter("max_similarity"))
 
     if request.include_entity and results:
         entity_ids = [result["entity_id"] for result in results]
@@ -524,7 +555,7 @@ def semantic_search_curations(
     search_time = total_time - query_embed_time
     
     return SemanticSearchResponse(
-        results=[SemanticSearchResult(**r) for r in results],
+        results=results,  # validated as a list in one pass by the response model
         query=request.query,
         query_embedding_time=round(query_embed_time, 3),
         search_time=round(search_time, 3),
@@ -557,8 +588,9 @@ def hybrid_search(
     
     entity_filter = {}
     
-    # Text search no nome
+    # Text search no nome ($text requires the startup text index)
     if request.query:
+        wait_for_indexes()
         entity_filter["$text"] = {"$search": request.query}
     
     # Location filter
@@ -666,24 +698,10 @@ def hybrid_search(
         matches = []
         similarities = []
         
-        for emb in embeddings:
-            # Filter by category if specified
-            if allowed_categories and emb.get("category") not in allowed_categories:
-                continue
-            
-            # Calculate cosine similarity
-            try:
-                concept_vector = np.asarray(emb["vector"], dtype=np.float32)
-                concept_norm = float(np.linalg.norm(concept_vector))
-                if concept_norm == 0.0:
-                    continue
-                similarity = float(
-                    np.dot(query_vector, concept_vector) / 
-                    (query_norm * concept_norm)
-                )
-            except Exception:
-                continue
-            
+        # Cosine similarity of every concept (filtered by category) at once
+        concepts, concept_similarities = score_concepts(embeddings, query_vector, query_norm, allowed_categories)
+        
+        for emb, similarity in zip(concepts, concept_similarities.tolist()):
             if similarity >= request.min_similarity:
                 similarities.append(similarity)
                 matches.append(ConceptMatch(
@@ -694,8 +712,8 @@ def hybrid_search(
                 ))
         
         if matches:
-            # Sort matches by similarity
-            matches.sort(key=lambda x: x.similarity, reverse=True)
+            # Keep the top 10 matches by similarity
+            top_matches = heapq.nlargest(10, matches, key=attrgetter("similarity"))
             
             # Use max similarity as semantic score
             semantic_score = max(similarities)
@@ -707,7 +725,7 @@ def hybrid_search(
             semantic_results[entity_key] = {
                 "curation": build_curation_response_payload(curation),
                 "semantic_score": semantic_score,
-                "matches": matches[:10],  # Top 10 matches
+                "matches": top_matches,
                 "entity_id_raw": entity_id,
             }
     
@@ -787,14 +805,13 @@ def hybrid_search(
         }
     
     # ========== 4. RANKEAR E LIMITAR ==========
-    results = list(combined.values())
-    results.sort(key=lambda x: x["score"], reverse=True)
-    results = results[:request.limit]
+    # nlargest is a partial sort: O(n log k) for the top request.limit results
+    results = heapq.nlargest(request.limit, combined.values(), key=itemgetter("score"))
     
     total_time = time.time() - start_time
     
     return HybridSearchResponse(
-        results=[HybridSearchResult(**r) for r in results],
+        results=results,  # validated as a list in one pass by the response model
         query=request.query,
         entity_search_time=round(entity_search_time, 3),
         semantic_search_time=round(semantic_search_time, 3),
@@ -2,14 +2,14 @@
 Entity endpoints - CRUD operations
 """
 
-from fastapi import APIRouter, HTTPException, Header, Query, Depends, Request
+from fastapi import APIRouter, HTTPException, Header, Query, Depends, Request, Response
 from typing import Optional, List
 from datetime import datetime, timezone
 from pymongo.errors import DuplicateKeyError
 from pymongo.database import Database
 
 from app.models.schemas import (
-    Entity, EntityCreate, EntityUpdate, PaginatedResponse, ErrorResponse,
+    Entity, EntityCreate, EntityUpdate, PaginatedResponse, ErrorResponse, ENTITY_LIST_ADAPTER,
     BulkEntityCreate, BulkOperationResponse, BulkItemError
 )
 from app.core.database import get_database
@@ -48,21 +48,20 @@ def create_entity(
             {"$set": doc}
         )
         
-        result = db.entities.find_one({"_id": entity.entity_id})
-        return Entity(**result)
+        return db.entities.find_one({"_id": entity.entity_id})
     
     else:
         # Create new
         doc = entity.model_dump()
         doc["_id"] = entity.entity_id
-        doc["createdAt"] = datetime.now(timezone.utc)
-        doc["updatedAt"] = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        doc["createdAt"] = now
+        doc["updatedAt"] = now
         doc["version"] = 1
         
         db.entities.insert_one(doc)
         
-        result = db.entities.find_one({"_id": entity.entity_id})
-        return Entity(**result)
+        return db.entities.find_one({"_id": entity.entity_id})
 
 
 @router.get("/{entity_id}", response_model=Entity)
@@ -76,7 +75,9 @@ def get_entity(
     if not result:
         raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found")
     
-    return Entity(**result)
+    # Return the stored document: response_model=Entity validates it once on
+    # the way out, so building an Entity here would validate it twice
+    return result
 
 
 @router.patch("/{entity_id}", response_model=Entity)
@@ -112,7 +113,7 @@ def update_entity(
     if not result:
         raise HTTPException(status_code=409, detail="Version conflict or not found")
     
-    return Entity(**result)
+    return result
 
 
 @router.delete("/{entity_id}", status_code=204)
@@ -171,18 +172,20 @@ def list_entities(
         total = db.entities.count_documents(query)
         cursor = db.entities.find(query).sort("_id", 1).skip(offset).limit(limit)
 
-    items = []
-    for doc in cursor:
+    docs = list(cursor)
+    for doc in docs:
         doc["_id"] = str(doc["_id"])
-        items.append(Entity(**doc))
-
-    return PaginatedResponse(
-        items=items,
+    page = PaginatedResponse(
+        items=ENTITY_LIST_ADAPTER.validate_python(docs),
         total=total,
         limit=limit,
         offset=offset
     )
 
+    # Items were validated once by the adapter; serialize directly instead of
+    # letting response_model (kept for the OpenAPI schema) check the page again
+    return Response(content=page.model_dump_json(by_alias=True), media_type="application/json")
+
 
 @router.post("/bulk", response_model=BulkOperationResponse, status_code=200)
 def bulk_upsert_entities(
@@ -9,9 +9,12 @@ These endpoints consolidate data from Google Places, MongoDB entities,
 Michelin guide, and curations into unified responses optimized for LLM consumption.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from functools import lru_cache
 from typing import Optional
+import hashlib
 import logging
+import orjson
 
 from app.models.llm_models import (
     LLMSearchRestaurantsRequest,
@@ -20,6 +23,8 @@ from app.models.llm_models import (
     LLMGetRestaurantSnapshotResponse,
     LLMGetRestaurantAvailabilityRequest,
     LLMGetRestaurantAvailabilityResponse,
+    LLMGetRestaurantBundleRequest,
+    LLMGetRestaurantBundleResponse,
 )
 from app.models.llm_tools import get_all_tools, get_tools_manifest
 from app.services.llm_place_service import LLMPlaceService
@@ -36,6 +41,57 @@ def get_llm_service() -> LLMPlaceService:
     return LLMPlaceService(database=get_database())
 
 
+@lru_cache(maxsize=2)
+def get_tools_json(verbose: bool = False) -> bytes:
+    """Serialized /tools payload (tool schemas are static, so encode once per variant)"""
+    return orjson.dumps({"tools": get_all_tools(verbose)})
+
+
+@lru_cache(maxsize=1)
+def get_manifest_json() -> bytes:
+    """Serialized /tools-manifest payload (encoded once)"""
+    return orjson.dumps(get_tools_manifest())
+
+
+@lru_cache(maxsize=2)
+def get_tools_etag(verbose: bool = False) -> str:
+    """Strong ETag for the /tools payload"""
+    return f'"{hashlib.sha256(get_tools_json(verbose)).hexdigest()}"'
+
+
+@lru_cache(maxsize=1)
+def get_manifest_etag() -> str:
+    """Strong ETag for the /tools-manifest payload"""
+    return f'"{hashlib.sha256(get_manifest_json()).hexdigest()}"'
+
+
+# Tool schemas only change with a deploy, so clients may keep them for an hour
+TOOLS_CACHE_CONTROL = "public, max-age=3600, immutable"
+
+
+def static_json_response(content: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """
+    Serve a static JSON payload with ETag revalidation.
+    
+    Args:
+        content: Pre-encoded JSON body
+        etag: Quoted ETag of the body
+        if_none_match: Value of the client's If-None-Match header
+        
+    Returns:
+        304 with no body if the client already has this version, else 200 with the body
+    """
+    headers = {"ETag": etag, "Cache-Control": TOOLS_CACHE_CONTROL}
+    
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @router.post("/search-restaurants", response_model=LLMSearchRestaurantsResponse)
 def search_restaurants(
     request: LLMSearchRestaurantsRequest,
@@ -72,7 +128,9 @@ def search_restaurants(
             region=request.region
         )
         
-        return LLMSearchRestaurantsResponse(
+        # items are already validated LLMSearchRestaurantItem instances built
+        # by the service, so skip re-validating them on the way out
+        response = LLMSearchRestaurantsResponse.model_construct(
             items=items,
             total_results=len(items),
             search_metadata={
@@ -80,6 +138,9 @@ def search_restaurants(
                 "location_biased": request.latitude is not None and request.longitude is not None
             }
         )
+        # Serialize once in Rust; returning the model would make FastAPI dump,
+        # re-validate and dump it again
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error in search-restaurants: {e}")
@@ -139,7 +200,8 @@ def get_restaurant_snapshot(
             timezone=request.timezone
         )
         
-        return LLMGetRestaurantSnapshotResponse(
+        # snapshot is a validated LLMRestaurantSnapshot; construct without re-validating
+        response = LLMGetRestaurantSnapshotResponse.model_construct(
             snapshot=snapshot,
             sources_used=sources_used,
             metadata={
@@ -151,6 +213,7 @@ def get_restaurant_snapshot(
                 "timezone": request.timezone
             }
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except HTTPException:
         raise
@@ -220,6 +283,54 @@ def get_restaurant_availability(
         raise HTTPException(status_code=500, detail=f"Availability error: {str(e)}")
 
 
+@router.post("/get-restaurant-bundle", response_model=LLMGetRestaurantBundleResponse)
+def get_restaurant_bundle(
+    request: LLMGetRestaurantBundleRequest,
+    service: LLMPlaceService = Depends(get_llm_service)
+):
+    """
+    Search and fetch snapshot + availability of the top result in one call.
+    
+    Collapses the usual search -> get-restaurant-snapshot ->
+    get-restaurant-availability chain into a single round-trip. The snapshot
+    is built once and availability is derived from it.
+    
+    Example use case:
+    User: "Is Dom Manolo open on Saturday?"
+    LLM: Calls this endpoint once instead of three chained endpoints
+    """
+    try:
+        logger.info(f"LLM get-restaurant-bundle: query='{request.query}', location=({request.latitude}, {request.longitude})")
+        
+        bundle = service.get_restaurant_bundle(
+            query=request.query,
+            latitude=request.latitude,
+            longitude=request.longitude,
+            radius_m=request.radius_m,
+            max_results=request.max_results,
+            language=request.language,
+            region=request.region,
+            include_snapshot=request.include_snapshot,
+            include_availability=request.include_availability,
+            timezone=request.timezone,
+            weekend_days=request.weekend_days
+        )
+        
+        availability = bundle["availability"]
+        response = LLMGetRestaurantBundleResponse.model_construct(
+            items=bundle["items"],
+            total_results=len(bundle["items"]),
+            snapshot=bundle["snapshot"],
+            availability=LLMGetRestaurantAvailabilityResponse(**availability) if availability else None,
+            sources_used=bundle["sources_used"]
+        )
+        return Response(content=response.model_dump_json(), media_type="application/json")
+        
+    except Exception as e:
+        logger.error(f"Error in get-restaurant-bundle: {e}")
+        raise HTTPException(status_code=500, detail=f"Bundle error: {str(e)}")
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for LLM Gateway"""
@@ -230,6 +341,7 @@ async def health_check():
             "/llm/search-restaurants",
             "/llm/get-restaurant-snapshot",
             "/llm/get-restaurant-availability",
+            "/llm/get-restaurant-bundle",
             "/llm/tools",
             "/llm/tools-manifest"
         ]
@@ -237,23 +349,27 @@ async def health_check():
 
 
 @router.get("/tools")
-def get_tools():
+def get_tools(
+    verbose: bool = Query(False, description="Include example use cases in tool descriptions"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
+):
     """
     Get MCP tool definitions.
     
     Returns the JSON Schema definitions for all available tools.
     This endpoint is used by MCP clients to discover available tools.
     
+    Descriptions are short by default; pass verbose=true for the example
+    use cases. Responses carry an ETag; send it back as If-None-Match to get a 304.
+    
     Returns:
         List of tool schemas in MCP format
     """
-    return {
-        "tools": get_all_tools()
-    }
+    return static_json_response(get_tools_json(verbose), get_tools_etag(verbose), if_none_match)
 
 
 @router.get("/tools-manifest")
-def get_manifest():
+def get_manifest(if_none_match: Optional[str] = Header(None, alias="If-None-Match")):
     """
     Get complete MCP tools manifest with metadata.
     
@@ -263,7 +379,9 @@ def get_manifest():
     - API endpoints
     - Data sources
     
+    Responses carry an ETag; send it back as If-None-Match to get a 304.
+    
     Returns:
         Complete manifest dictionary
     """
-    return get_tools_manifest()
+    return static_json_response(get_manifest_json(), get_manifest_etag(), if_none_match)
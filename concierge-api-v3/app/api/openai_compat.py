@@ -8,8 +8,11 @@ This router provides OpenAI-compatible endpoints that work with LM Studio
 and other OpenAI-compatible clients for function calling / tool use.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import logging
 import time
@@ -22,6 +25,7 @@ from app.models.openai_models import (
     ChatCompletionRequest,
     ChatCompletionResponse,
     ChatMessage,
+    CHAT_MESSAGES_ADAPTER,
     Choice,
     ResponseMessage,
     Usage,
@@ -33,6 +37,7 @@ from app.models.openai_models import (
     ModelsResponse,
     Model
 )
+from app.models.llm_models import LLMSearchRestaurantsResponse, LLMGetRestaurantSnapshotResponse
 from app.services.llm_place_service import LLMPlaceService
 from app.core.database import get_database
 
@@ -51,11 +56,14 @@ def get_llm_service() -> LLMPlaceService:
 # FUNCTION DEFINITIONS (Convert from LLM tools to OpenAI format)
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def get_available_functions() -> List[Tool]:
     """
     Get list of available functions in OpenAI format.
     
     These match the LLM Gateway tools but in OpenAI/LM Studio format.
+    The definitions are static, so the Tool models are built and validated
+    once and the cached list is shared (treat it as read-only).
     """
     return [
         Tool(
@@ -204,10 +212,28 @@ def get_available_functions() -> List[Tool]:
     ]
 
 
+@lru_cache(maxsize=1)
+def get_functions_listing() -> Dict[str, Any]:
+    """Function definitions as plain dicts for /v1/functions (dumped once)"""
+    tools = get_available_functions()
+    return {
+        "functions": [tool.function.model_dump() for tool in tools],
+        "count": len(tools)
+    }
+
+
 # ============================================================================
 # FUNCTION EXECUTION
 # ============================================================================
 
+# Functions whose schema has oneOf place_id / entity_id
+PLACE_ID_FUNCTIONS = frozenset({
+    "get_restaurant_snapshot",
+    "get_restaurant_availability",
+    "get_restaurant_photos",
+})
+
+
 def execute_function(
     function_name: str,
     arguments: Dict[str, Any],
@@ -224,6 +250,11 @@ def execute_function(
     Returns:
         JSON string with function result
     """
+    # Cheap key check for the schema's oneOf, before any DB/Google work.
+    # Both ids are accepted like the gateway does (entity_id takes priority).
+    if function_name in PLACE_ID_FUNCTIONS and not (arguments.get("place_id") or arguments.get("entity_id")):
+        return json.dumps({"error": "place_id or entity_id parameter is required"})
+    
     try:
         if function_name == "search_restaurants":
             query = arguments.get("query")
@@ -240,12 +271,9 @@ def execute_function(
                 region=arguments.get("region", "BR")
             )
             
-            # Convert to dict for JSON serialization
-            result = {
-                "items": [item.dict() for item in items],
-                "total_results": len(items)
-            }
-            return json.dumps(result, ensure_ascii=False)
+            # Serialize straight from the models (no intermediate dicts)
+            result = LLMSearchRestaurantsResponse.model_construct(items=items, total_results=len(items))
+            return result.model_dump_json(exclude={"search_metadata"})
             
         elif function_name == "get_restaurant_snapshot":
             snapshot, sources = service.get_restaurant_snapshot(
@@ -253,11 +281,8 @@ def execute_function(
                 entity_id=arguments.get("entity_id")
             )
             
-            result = {
-                "snapshot": snapshot.dict() if snapshot else None,
-                "sources_used": sources
-            }
-            return json.dumps(result, ensure_ascii=False)
+            result = LLMGetRestaurantSnapshotResponse.model_construct(snapshot=snapshot, sources_used=sources)
+            return result.model_dump_json(exclude={"metadata"})
             
         elif function_name == "get_restaurant_availability":
             availability = service.get_restaurant_availability(
@@ -293,6 +318,10 @@ def execute_function(
 # ENDPOINTS
 # ============================================================================
 
+# The model "exists" from process start; report a stable creation time
+MODEL_CREATED = int(time.time())
+
+
 @router.get("/v1/models", response_model=ModelsResponse)
 async def list_models(
     auth: dict = Depends(verify_auth),
@@ -308,7 +337,7 @@ async def list_models(
             Model(
                 id="concierge-restaurant",
                 object="model",
-                created=int(time.time()),
+                created=MODEL_CREATED,
                 owned_by="concierge"
             )
         ]
@@ -325,16 +354,63 @@ async def list_functions(
     This endpoint returns all function definitions that can be used
     with the chat completions endpoint.
     """
-    tools = get_available_functions()
-    return {
-        "functions": [tool.function.dict() for tool in tools],
-        "count": len(tools)
+    return get_functions_listing()
+
+
+# ============================================================================
+# REQUEST PARSING
+# ============================================================================
+
+def inline_json_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    """
+    JSON schema for a model with its $defs inlined.
+    
+    Used to document bodies that are parsed by hand (openapi_extra cannot
+    register nested models under components/schemas).
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    
+    return resolve(schema)
+
+
+CHAT_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": inline_json_schema(ChatCompletionRequest)}},
     }
+}
 
 
-@router.post("/v1/chat/completions")
+async def parse_chat_request(http_request: Request) -> ChatCompletionRequest:
+    """
+    Validate the raw request body straight from JSON bytes.
+    
+    model_validate_json parses and validates in one pass in pydantic-core,
+    instead of FastAPI's json.loads to a dict followed by validation.
+    
+    Raises:
+        RequestValidationError: 422 with the same shape FastAPI would return
+    """
+    try:
+        return ChatCompletionRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        raise RequestValidationError(errors)
+
+
+@router.post("/v1/chat/completions", openapi_extra=CHAT_REQUEST_OPENAPI)
 async def chat_completions(
-    request: ChatCompletionRequest,
+    http_request: Request,
     auth: dict = Depends(verify_auth),
     service: LLMPlaceService = Depends(get_llm_service)
 ):
@@ -358,6 +434,8 @@ async def chat_completions(
     3. If tool_calls present, execute them (parallel if enabled)
     4. Return response with tools array so LLM knows what's available
     """
+    request = await parse_chat_request(http_request)
+    
     try:
         # Get available tools
         available_tools = get_available_functions()
@@ -385,6 +463,9 @@ async def chat_completions(
             messages.insert(0, system_msg)
             logger.info("Injected system message with tool descriptions")
         
+        # Rough prompt size for the usage block: the conversation as JSON
+        prompt_size = len(CHAT_MESSAGES_ADAPTER.dump_json(messages))
+        
         # Get last message
         last_message = messages[-1]
         
@@ -459,29 +540,35 @@ async def chat_completions(
                     media_type="text/event-stream"
                 )
             
-            # Return standard response with tools array
-            return ChatCompletionResponse(
+            calls_json = json.dumps(executed_calls, ensure_ascii=False)
+            
+            # Return standard response with tools array (server-built,
+            # so construct without re-validating)
+            response = ChatCompletionResponse.model_construct(
                 id=response_id,
                 object="chat.completion",
                 created=int(time.time()),
                 model=request.model,
                 choices=[
-                    Choice(
+                    Choice.model_construct(
                         index=0,
-                        message=ResponseMessage(
+                        message=ResponseMessage.model_construct(
                             role="assistant",
-                            content=json.dumps(executed_calls, ensure_ascii=False)
+                            content=calls_json
                         ),
                         finish_reason="tool_calls"
                     )
                 ],
-                usage=Usage(
-                    prompt_tokens=len(json.dumps([msg if isinstance(msg, dict) else msg.dict() for msg in messages])),
-                    completion_tokens=len(json.dumps(executed_calls)),
-                    total_tokens=len(json.dumps([msg if isinstance(msg, dict) else msg.dict() for msg in messages])) + len(json.dumps(executed_calls))
+                usage=Usage.model_construct(
+                    prompt_tokens=prompt_size,
+                    completion_tokens=len(calls_json),
+                    total_tokens=prompt_size + len(calls_json)
                 ),
                 system_fingerprint="concierge-restaurant"
             )
+            # Serialize once in Rust; returning the model would make FastAPI
+            # walk it through jsonable_encoder before orjson sees it
+            return Response(content=response.model_dump_json(), media_type="application/json")
         
         # If no tool calls, return informative message with tools array
         # This allows LLM to see what tools are available
@@ -505,28 +592,29 @@ async def chat_completions(
                     "I can search for restaurants, get detailed information, and check availability."
                 )
             
-            return ChatCompletionResponse(
+            response = ChatCompletionResponse.model_construct(
                 id=response_id,
                 object="chat.completion",
                 created=int(time.time()),
                 model=request.model,
                 choices=[
-                    Choice(
+                    Choice.model_construct(
                         index=0,
-                        message=ResponseMessage(
+                        message=ResponseMessage.model_construct(
                             role="assistant",
                             content=content
                         ),
                         finish_reason=finish_reason
                     )
                 ],
-                usage=Usage(
-                    prompt_tokens=len(json.dumps([msg if isinstance(msg, dict) else msg.dict() for msg in messages])),
+                usage=Usage.model_construct(
+                    prompt_tokens=prompt_size,
                     completion_tokens=len(content.split()),
-                    total_tokens=len(json.dumps([msg if isinstance(msg, dict) else msg.dict() for msg in messages])) + len(content.split())
+                    total_tokens=prompt_size + len(content.split())
                 ),
                 system_fingerprint="concierge-restaurant"
             )
+            return Response(content=response.model_dump_json(), media_type="application/json")
             
     except json.JSONDecodeError as e:
         logger.error(f"JSON decode error: {e}")
@@ -551,11 +639,14 @@ async def _stream_tool_results(
         executed_calls: List of executed tool calls with results
         tools: Available tools array
     """
+    # Every chunk of one completion shares the same created timestamp
+    created = int(time.time())
+    
     # Send initial chunk with role
     chunk = {
         "id": response_id,
         "object": "chat.completion.chunk",
-        "created": int(time.time()),
+        "created": created,
         "model": model,
         "choices": [{
             "index": 0,
@@ -570,7 +661,7 @@ async def _stream_tool_results(
         chunk = {
             "id": response_id,
             "object": "chat.completion.chunk",
-            "created": int(time.time()),
+            "created": created,
             "model": model,
             "choices": [{
                 "index": 0,
@@ -587,7 +678,7 @@ async def _stream_tool_results(
     chunk = {
         "id": response_id,
         "object": "chat.completion.chunk",
-        "created": int(time.time()),
+        "created": created,
         "model": model,
         "choices": [{
             "index": 0,
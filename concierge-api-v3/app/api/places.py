@@ -1,7 +1,7 @@
 """
 File: places.py
 Purpose: Google Places API (New) proxy endpoints
-Dependencies: fastapi, httpx, app.core.config
+Dependencies: fastapi, app.core.config, app.services.http_client
 Last Updated: November 17, 2025
 
 This module provides secure proxy endpoints for Google Places API (New).
@@ -12,10 +12,10 @@ Uses the modern Places API (New) with HTTP requests.
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
-import httpx
 import logging
 
 from app.core.config import settings
+from app.services.http_client import get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -372,22 +372,22 @@ async def _nearby_search(
     }
     
     # Make request
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            PLACES_API_NEARBY_URL,
-            json=payload,
-            headers=headers
+    client = get_http_client()
+    response = await client.post(
+        PLACES_API_NEARBY_URL,
+        json=payload,
+        headers=headers
+    )
+    
+    if response.status_code != 200:
+        error_text = response.text
+        logger.error(f"Places API error: {response.status_code} - {error_text}")
+        raise HTTPException(
+            status_code=502,
+            detail=f"Google Places API error: {error_text}"
         )
-        
-        if response.status_code != 200:
-            error_text = response.text
-            logger.error(f"Places API error: {response.status_code} - {error_text}")
-            raise HTTPException(
-                status_code=502,
-                detail=f"Google Places API error: {error_text}"
-            )
-        
-        data = response.json()
+    
+    data = response.json()
     
     # Format results
     places = data.get('places', [])
@@ -498,22 +498,22 @@ async def _text_search(
     }
     
     # Make request
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            PLACES_API_TEXT_SEARCH_URL,
-            json=payload,
-            headers=headers
+    client = get_http_client()
+    response = await client.post(
+        PLACES_API_TEXT_SEARCH_URL,
+        json=payload,
+        headers=headers
+    )
+    
+    if response.status_code != 200:
+        error_text = response.text
+        logger.error(f"Text Search API error: {response.status_code} - {error_text}")
+        raise HTTPException(
+            status_code=502,
+            detail=f"Google Places API error: {error_text}"
         )
-        
-        if response.status_code != 200:
-            error_text = response.text
-            logger.error(f"Text Search API error: {response.status_code} - {error_text}")
-            raise HTTPException(
-                status_code=502,
-                detail=f"Google Places API error: {error_text}"
-            )
-        
-        data = response.json()
+    
+    data = response.json()
     
     # Format results (same format as nearby search)
     places = data.get('places', [])
@@ -621,18 +621,18 @@ async def get_place_details(
         }
         
         # Make request
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            
-            if response.status_code != 200:
-                error_text = response.text
-                logger.error(f"Places API error: {response.status_code} - {error_text}")
-                raise HTTPException(
-                    status_code=502,
-                    detail=f"Google Places API error: {error_text}"
-                )
-            
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(url, headers=headers)
+        
+        if response.status_code != 200:
+            error_text = response.text
+            logger.error(f"Places API error: {response.status_code} - {error_text}")
+            raise HTTPException(
+                status_code=502,
+                detail=f"Google Places API error: {error_text}"
+            )
+        
+        data = response.json()
         
         return PlaceDetailsResponse(
             result=data,
@@ -1,20 +1,24 @@
 """
 File: places_orchestrate.py
 Purpose: Google Places API orchestration endpoint - single endpoint for all place operations
-Dependencies: fastapi, httpx, app.core.config
+Dependencies: fastapi, httpx, asyncio, app.core.config, app.services.http_client, app.services.request_coalescer, app.services.response_cache
 Last Updated: November 21, 2025
 
 This module provides a unified orchestration endpoint for Google Places API (New).
 Intelligently routes requests to the appropriate Places API based on input parameters.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Response
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+import asyncio
 import httpx
 import logging
 
 from app.core.config import settings
+from app.services.http_client import get_http_client
+from app.services.request_coalescer import RequestCoalescer, request_fingerprint
+from app.services.response_cache import ResponseCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,6 +32,19 @@ PLACES_API_TEXT_SEARCH_URL = "https://places.googleapis.com/v1/places:searchText
 PLACES_API_DETAILS_URL = "https://places.googleapis.com/v1/places"
 PLACES_API_AUTOCOMPLETE_URL = "https://places.googleapis.com/v1/places:autocomplete"
 
+# Concurrent identical Places calls share one in-flight request
+places_coalescer = RequestCoalescer()
+
+# Repeat orchestration requests are served from cache until the TTL expires
+places_cache = ResponseCache(ttl=settings.places_cache_ttl)
+
+# Settings are loaded once at startup, so the health payload never changes
+HEALTH_RESPONSE = {
+    "status": "healthy",
+    "service": "places_orchestration",
+    "api_key_configured": bool(settings.google_places_api_key)
+}
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -36,6 +53,9 @@ PLACES_API_AUTOCOMPLETE_URL = "https://places.googleapis.com/v1/places:autocompl
 class PlacesOrchestrationRequest(BaseModel):
     """Unified request for all Places API operations"""
     
+    # Requests are never mutated after parsing; their dump keys the response cache
+    model_config = ConfigDict(frozen=True)
+    
     # Search parameters
     query: Optional[str] = Field(None, description="Text query for search")
     place_id: Optional[str] = Field(None, description="Place ID for details lookup")
@@ -96,6 +116,11 @@ def determine_operation(request: PlacesOrchestrationRequest) -> str:
     5. query + location -> Text Search API (with location bias)
     6. location + types -> Nearby Search API
     7. location only -> Nearby Search API
+    
+    The order is precedence, not frequency: requests may set several fields
+    (e.g. query + place_ids), so checks must not be reordered. Each check is
+    a single attribute read, and plain text search falls through after three
+    None tests.
     """
     
     # Case 0: Bulk operations
@@ -122,6 +147,25 @@ def determine_operation(request: PlacesOrchestrationRequest) -> str:
     return "autocomplete"
 
 
+async def _post_places_request(url: str, headers: Dict[str, str], body: Dict[str, Any]) -> Dict[str, Any]:
+    """POST a search body to the Places API and return the decoded response"""
+    
+    client = get_http_client()
+    response = await client.post(
+        url,
+        headers=headers,
+        json=body
+    )
+    
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Places API error: {response.text}"
+        )
+    
+    return response.json()
+
+
 async def call_nearby_search(request: PlacesOrchestrationRequest) -> Dict[str, Any]:
     """Call Nearby Search API"""
     
@@ -152,20 +196,10 @@ async def call_nearby_search(request: PlacesOrchestrationRequest) -> Dict[str, A
     if request.rank_preference:
         body["rankPreference"] = request.rank_preference
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            PLACES_API_NEARBY_URL,
-            headers=headers,
-            json=body
-        )
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Places API error: {response.text}"
-            )
-        
-        return response.json()
+    return await places_coalescer.get_or_create(
+        request_fingerprint("nearby", body),
+        lambda: _post_places_request(PLACES_API_NEARBY_URL, headers, body)
+    )
 
 
 async def call_text_search(request: PlacesOrchestrationRequest) -> Dict[str, Any]:
@@ -209,20 +243,10 @@ async def call_text_search(request: PlacesOrchestrationRequest) -> Dict[str, Any
     if request.region_code:
         body["regionCode"] = request.region_code
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            PLACES_API_TEXT_SEARCH_URL,
-            headers=headers,
-            json=body
-        )
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Places API error: {response.text}"
-            )
-        
-        return response.json()
+    return await places_coalescer.get_or_create(
+        request_fingerprint("text_search", body),
+        lambda: _post_places_request(PLACES_API_TEXT_SEARCH_URL, headers, body)
+    )
 
 
 async def call_place_details(request: PlacesOrchestrationRequest) -> Dict[str, Any]:
@@ -240,7 +264,8 @@ async def call_place_details(request: PlacesOrchestrationRequest) -> Dict[str, A
     if request.region_code:
         params["regionCode"] = request.region_code
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async def fetch_details() -> Dict[str, Any]:
+        client = get_http_client()
         response = await client.get(
             f"{PLACES_API_DETAILS_URL}/{request.place_id}",
             headers=headers,
@@ -254,11 +279,18 @@ async def call_place_details(request: PlacesOrchestrationRequest) -> Dict[str, A
             )
         
         return response.json()
+    
+    return await places_coalescer.get_or_create(
+        request_fingerprint("details", {"place_id": request.place_id, **params}),
+        fetch_details
+    )
 
 
 async def call_bulk_details(place_ids: List[str], request: PlacesOrchestrationRequest) -> Dict[str, Any]:
     """
     Call Place Details API for multiple place IDs in parallel.
+    Duplicate place IDs are fetched once.
+    At most `settings.places_max_concurrency` requests are in flight at once.
     Returns combined results and tracks errors.
     """
     
@@ -274,37 +306,47 @@ async def call_bulk_details(place_ids: List[str], request: PlacesOrchestrationRe
     if request.region_code:
         params["regionCode"] = request.region_code
     
+    # Drop duplicate place IDs (order preserved) so each place is fetched once
+    place_ids = list(dict.fromkeys(place_ids))
+    
     results = []
     errors = []
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Create tasks for parallel execution
-        tasks = []
-        for place_id in place_ids:
-            task = client.get(
-                f"{PLACES_API_DETAILS_URL}/{place_id}",
-                headers=headers,
-                params=params
+    semaphore = asyncio.Semaphore(settings.places_max_concurrency)
+    
+    client = get_http_client()
+    
+    async def fetch_details(place_id: str) -> httpx.Response:
+        # Semaphore keeps a sliding window of in-flight requests
+        async with semaphore:
+            return await places_coalescer.get_or_create(
+                request_fingerprint("bulk_details", {"place_id": place_id, **params}),
+                lambda: client.get(
+                    f"{PLACES_API_DETAILS_URL}/{place_id}",
+                    headers=headers,
+                    params=params
+                )
             )
-            tasks.append((place_id, task))
-        
-        # Execute all requests in parallel
-        for place_id, task in tasks:
-            try:
-                response = await task
-                if response.status_code == 200:
-                    results.append(response.json())
-                else:
-                    errors.append({
-                        "place_id": place_id,
-                        "status_code": response.status_code,
-                        "error": response.text
-                    })
-            except Exception as e:
-                errors.append({
-                    "place_id": place_id,
-                    "error": str(e)
-                })
+    
+    # Execute all requests in parallel
+    responses = await asyncio.gather(
+        *(fetch_details(place_id) for place_id in place_ids),
+        return_exceptions=True
+    )
+    
+    for place_id, response in zip(place_ids, responses):
+        if isinstance(response, Exception):
+            errors.append({
+                "place_id": place_id,
+                "error": str(response)
+            })
+        elif response.status_code == 200:
+            results.append(response.json())
+        else:
+            errors.append({
+                "place_id": place_id,
+                "status_code": response.status_code,
+                "error": response.text
+            })
     
     return {
         "places": results,
@@ -317,8 +359,9 @@ async def call_bulk_details(place_ids: List[str], request: PlacesOrchestrationRe
 
 async def call_bulk_multi_operations(operations: List[Dict[str, Any]], base_request: PlacesOrchestrationRequest) -> Dict[str, Any]:
     """
-    Execute multiple different operations in sequence or parallel.
+    Execute multiple different operations in parallel.
     Each operation can be: nearby, text_search, or details.
+    At most `settings.places_max_concurrency` operations are in flight at once.
     
     Example operations list:
     [
@@ -331,40 +374,58 @@ async def call_bulk_multi_operations(operations: List[Dict[str, Any]], base_requ
     all_results = []
     all_errors = []
     operations_executed = []
+    semaphore = asyncio.Semaphore(settings.places_max_concurrency)
+    
+    # Create a base request dict for the operations (exclude operations to avoid recursion)
+    base_dict = base_request.model_dump(exclude_none=True)
+    base_dict.pop('operations', None)  # Remove operations to prevent recursion
+    base_dict.pop('place_ids', None)   # Remove place_ids to prevent confusion
+    
+    async def execute_operation(operation_type: str, op_request: PlacesOrchestrationRequest) -> List[Dict[str, Any]]:
+        # Semaphore keeps a sliding window of in-flight requests
+        async with semaphore:
+            if operation_type == "details":
+                return [await call_place_details(op_request)]
+            if operation_type == "text_search":
+                data = await call_text_search(op_request)
+                return data.get("places", [])
+            if operation_type == "nearby":
+                data = await call_nearby_search(op_request)
+                return data.get("places", [])
+            return []
     
+    pending = []
     for op_config in operations:
         try:
-            # Create a request object for this operation (exclude operations to avoid recursion)
-            base_dict = base_request.dict(exclude_none=True)
-            base_dict.pop('operations', None)  # Remove operations to prevent recursion
-            base_dict.pop('place_ids', None)   # Remove place_ids to prevent confusion
-            
             op_request = PlacesOrchestrationRequest(
                 **{**base_dict, **op_config}
             )
-            
-            # Determine operation type for this specific request
-            operation_type = op_config.get("operation") or determine_operation(op_request)
-            operations_executed.append(operation_type)
-            
-            # Execute the operation
-            if operation_type == "details":
-                data = await call_place_details(op_request)
-                all_results.append(data)
-                
-            elif operation_type == "text_search":
-                data = await call_text_search(op_request)
-                all_results.extend(data.get("places", []))
-                
-            elif operation_type == "nearby":
-                data = await call_nearby_search(op_request)
-                all_results.extend(data.get("places", []))
-                
         except Exception as e:
             all_errors.append({
                 "operation": op_config,
                 "error": str(e)
             })
+            continue
+        
+        # Determine operation type for this specific request
+        operation_type = op_config.get("operation") or determine_operation(op_request)
+        operations_executed.append(operation_type)
+        pending.append((op_config, execute_operation(operation_type, op_request)))
+    
+    # Execute the operations in parallel, collecting per-operation errors
+    outcomes = await asyncio.gather(
+        *(coro for _, coro in pending),
+        return_exceptions=True
+    )
+    
+    for (op_config, _), outcome in zip(pending, outcomes):
+        if isinstance(outcome, Exception):
+            all_errors.append({
+                "operation": op_config,
+                "error": str(outcome)
+            })
+        else:
+            all_results.extend(outcome)
     
     return {
         "places": all_results,
@@ -376,6 +437,54 @@ async def call_bulk_multi_operations(operations: List[Dict[str, Any]], base_requ
     }
 
 
+# ============================================================================
+# OPERATION DISPATCH
+# ============================================================================
+
+# Each handler returns (data, results, errors, operations_executed, response_operation)
+OperationResult = Tuple[Dict[str, Any], List[Dict[str, Any]], Optional[List[Dict[str, Any]]], Optional[List[str]], str]
+
+
+async def _handle_bulk_multi(request: PlacesOrchestrationRequest) -> OperationResult:
+    """Execute multiple different operations"""
+    data = await call_bulk_multi_operations(request.operations, request)
+    return data, data.get("places", []), data.get("errors") or None, data.get("operations_executed"), "bulk"
+
+
+async def _handle_bulk_details(request: PlacesOrchestrationRequest) -> OperationResult:
+    """Bulk details lookup for multiple place IDs"""
+    data = await call_bulk_details(request.place_ids, request)
+    operations_executed = ["details"] * data.get("total_requested", 0)
+    return data, data.get("places", []), data.get("errors") or None, operations_executed, "bulk"
+
+
+async def _handle_details(request: PlacesOrchestrationRequest) -> OperationResult:
+    """Single place details (result wrapped in a list)"""
+    data = await call_place_details(request)
+    return data, [data], None, None, "details"
+
+
+async def _handle_text_search(request: PlacesOrchestrationRequest) -> OperationResult:
+    """Text search"""
+    data = await call_text_search(request)
+    return data, data.get("places", []), None, None, "text_search"
+
+
+async def _handle_nearby(request: PlacesOrchestrationRequest) -> OperationResult:
+    """Nearby search"""
+    data = await call_nearby_search(request)
+    return data, data.get("places", []), None, None, "nearby"
+
+
+OPERATION_DISPATCH: Dict[str, Callable[[PlacesOrchestrationRequest], Awaitable[OperationResult]]] = {
+    "bulk_multi": _handle_bulk_multi,
+    "bulk_details": _handle_bulk_details,
+    "details": _handle_details,
+    "text_search": _handle_text_search,
+    "nearby": _handle_nearby,
+}
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
@@ -401,54 +510,28 @@ async def orchestrate_places_request(request: PlacesOrchestrationRequest):
     """
     
     try:
+        # Serve repeat requests from cache
+        cache_key = "places:" + request_fingerprint("orchestrate", request.model_dump(exclude_none=True))
+        cached = places_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Places cache hit (stats={places_cache.stats()})")
+            return Response(content=cached, media_type="application/json")
+        
         # Determine which operation to perform
         operation = determine_operation(request)
         logger.info(f"Orchestrating Places API request: operation={operation}")
         
-        errors = None
-        operations_executed = None
-        
         # Call appropriate API
-        if operation == "bulk_multi":
-            # Execute multiple different operations
-            if not request.operations:
-                raise HTTPException(status_code=400, detail="operations list is required for bulk_multi mode")
-            data = await call_bulk_multi_operations(request.operations, request)
-            results = data.get("places", [])
-            errors = data.get("errors") if data.get("errors") else None
-            operations_executed = data.get("operations_executed")
-            operation = "bulk"
-            
-        elif operation == "bulk_details":
-            # Bulk details lookup for multiple place IDs
-            if not request.place_ids:
-                raise HTTPException(status_code=400, detail="place_ids list is required for bulk_details mode")
-            data = await call_bulk_details(request.place_ids, request)
-            results = data.get("places", [])
-            errors = data.get("errors") if data.get("errors") else None
-            operations_executed = ["details"] * data.get("total_requested", 0)
-            operation = "bulk"
-            
-        elif operation == "details":
-            data = await call_place_details(request)
-            results = [data]  # Wrap single result in array
-            
-        elif operation == "text_search":
-            data = await call_text_search(request)
-            results = data.get("places", [])
-            
-        elif operation == "nearby":
-            data = await call_nearby_search(request)
-            results = data.get("places", [])
-            
-        else:
+        handler = OPERATION_DISPATCH.get(operation)
+        if handler is None:
             raise HTTPException(
                 status_code=400,
                 detail="Unable to determine operation from request parameters"
             )
+        data, results, errors, operations_executed, operation = await handler(request)
         
         # Build response
-        return PlacesOrchestrationResponse(
+        response = PlacesOrchestrationResponse(
             operation=operation,
             results=results,
             total_results=len(results),
@@ -457,6 +540,16 @@ async def orchestrate_places_request(request: PlacesOrchestrationRequest):
             errors=errors
         )
         
+        # Serialize once (pydantic-core) and return the bytes directly, so
+        # FastAPI does not re-validate and re-encode the results list
+        payload = response.model_dump_json()
+        
+        # Only cache complete, single-page responses
+        if not response.next_page_token and not response.errors:
+            places_cache.set(cache_key, payload)
+        
+        return Response(content=payload, media_type="application/json")
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -470,8 +563,4 @@ async def orchestrate_places_request(request: PlacesOrchestrationRequest):
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "places_orchestration",
-        "api_key_configured": bool(settings.google_places_api_key)
-    }
+    return HEALTH_RESPONSE
@@ -26,7 +26,7 @@ def get_llm_service() -> LLMPlaceService:
 
 
 @router.get("/{place_id}/photos")
-async def get_place_photos(
+def get_place_photos(
     place_id: str,
     max_photos: int = Query(10, ge=1, le=10, description="Maximum number of photos (1-10)"),
     max_width: Optional[int] = Query(None, ge=400, le=4800, description="Maximum width in pixels (400-4800)"),
@@ -41,6 +41,9 @@ async def get_place_photos(
     Returns photo URLs and optional metadata (dimensions, attributions).
     Photos are automatically resized if max_width or max_height specified.
     
+    Declared as plain `def`: LLMPlaceService does blocking Mongo/HTTP I/O, so
+    FastAPI runs this endpoint in its threadpool instead of the event loop.
+    
     **Example:**
     ```
     GET /api/v3/places/ChIJxxx/photos?max_photos=5&max_width=800
@@ -87,5 +90,7 @@ async def get_place_photos(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching photos for {place_id}: {e}", exc_info=True)
+        # Traceback only at DEBUG; formatting it on every failure is costly during a Places outage
+        logger.error(f"Error fetching photos for {place_id}: {type(e).__name__}: {e}")
+        logger.debug("Photo fetch traceback", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,6 +4,7 @@ Loads from environment variables and .env file
 Automatically detects localhost vs production environment
 """
 
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings
 from typing import List
 import json
@@ -16,6 +17,10 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_url: str
     mongodb_db_name: str = "concierge-collector"
+    mongodb_max_pool_size: int = 100  # Connections per process
+    mongodb_min_pool_size: int = 5  # Warm connections kept open
+    mongodb_wait_queue_timeout_ms: int = 5000  # Fail fast when the pool is exhausted
+    mongodb_max_idle_time_ms: int = 60000
     
     # API
     api_v3_host: str = "0.0.0.0"
@@ -30,6 +35,8 @@ class Settings(BaseSettings):
     
     # Google Places API
     google_places_api_key: str = ""
+    places_max_concurrency: int = 10  # Max in-flight Places calls per bulk request
+    places_cache_ttl: int = 3600  # Seconds to cache orchestration responses (0 disables)
     
     # OpenAI API
     openai_api_key: str = ""
@@ -40,7 +47,7 @@ class Settings(BaseSettings):
     # Google OAuth
     google_oauth_client_id: str = ""
     google_oauth_client_secret: str = ""
-    google_oauth_redirect_uri: str = ""  # Will be auto-detected
+    google_oauth_redirect_uri: str = Field(default="", validate_default=True)  # Will be auto-detected
     
     # Frontend URLs (localhost and production)
     frontend_url: str = "http://127.0.0.1:5500"
@@ -53,8 +60,15 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 60  # 1 hour
     refresh_token_expire_days: int = 30  # 30 days for refresh token
     
-    def model_post_init(self, __context):
-        """Called after model initialization - auto-detect environment"""
+    # Parsed once in model_post_init
+    _cors_list: List[str] = PrivateAttr(default_factory=list)
+    
+    @field_validator('google_oauth_redirect_uri')
+    def default_redirect_uri(cls, v):
+        """Auto-detect the OAuth redirect URI from the deployment environment if not set"""
+        if v:
+            return v
+        
         # Check for deployment environment
         hostname = os.getenv('HOSTNAME', '')
         render_service = os.getenv('RENDER_SERVICE_NAME', '')
@@ -62,28 +76,25 @@ class Settings(BaseSettings):
         is_pythonanywhere = 'pythonanywhere' in hostname.lower() or os.path.exists('/home/wsmontes')
         is_render = bool(render_service) or 'render' in hostname.lower()
         
-        # Set redirect_uri based on environment if not already set
-        if not self.google_oauth_redirect_uri:
-            if is_render:
-                object.__setattr__(self, 'google_oauth_redirect_uri', 
-                                 "https://concierge-collector.onrender.com/api/v3/auth/callback")
-            elif is_pythonanywhere:
-                object.__setattr__(self, 'google_oauth_redirect_uri', 
-                                 "https://wsmontes.pythonanywhere.com/api/v3/auth/callback")
-            else:
-                object.__setattr__(self, 'google_oauth_redirect_uri',
-                                 "http://localhost:8000/api/v3/auth/callback")
+        if is_render:
+            return "https://concierge-collector.onrender.com/api/v3/auth/callback"
+        if is_pythonanywhere:
+            return "https://wsmontes.pythonanywhere.com/api/v3/auth/callback"
+        return "http://localhost:8000/api/v3/auth/callback"
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string or JSON"""
+    def model_post_init(self, __context):
+        """Called after model initialization - parse derived settings"""
+        # Parse CORS origins once: JSON first, then comma-separated string
         try:
-            # Try JSON first
-            return json.loads(self.cors_origins)
-        except Exception:
-            # Fall back to comma-separated string
+            origins = json.loads(self.cors_origins)
+        except json.JSONDecodeError:
             origins = [origin.strip() for origin in self.cors_origins.split(',')]
-            return origins if origins else ["http://localhost:3000"]
+        self._cors_list = origins if origins else ["http://localhost:3000"]
+    
+    @property
+    def cors_origins_list(self) -> List[str]:
+        """CORS origins parsed from comma-separated string or JSON"""
+        return self._cors_list
 
     @property
     def trusted_callback_origins_list(self) -> List[str]:
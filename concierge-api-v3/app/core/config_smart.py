@@ -10,8 +10,9 @@ No manual configuration needed - just set one environment variable!
 """
 
 from pydantic_settings import BaseSettings
-from pydantic import field_validator
-from typing import List
+from pydantic import Field, PrivateAttr, field_validator
+from functools import lru_cache
+from typing import List, Tuple
 import json
 import os
 import socket
@@ -21,9 +22,10 @@ class EnvironmentDetector:
     """Automatically detects the current deployment environment"""
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def detect() -> str:
         """
-        Detect environment based on various indicators
+        Detect environment based on various indicators (computed once per process)
         
         Returns:
             str: 'development', 'pythonanywhere', 'docker', or 'production'
@@ -51,13 +53,15 @@ class EnvironmentDetector:
     @staticmethod
     def is_pythonanywhere() -> bool:
         """Detect if running on PythonAnywhere"""
-        indicators = [
-            os.path.exists('/home/wsmontes'),  # User home directory
-            'pythonanywhere' in socket.gethostname().lower(),
-            'PYTHONANYWHERE_SITE' in os.environ,
-            'PYTHONANYWHERE_DOMAIN' in os.environ,
-        ]
-        return any(indicators)
+        # Cheapest checks first; hostname lookup only if nothing else matched
+        if 'PYTHONANYWHERE_SITE' in os.environ or 'PYTHONANYWHERE_DOMAIN' in os.environ:
+            return True
+        if os.path.exists('/home/wsmontes'):  # User home directory
+            return True
+        try:
+            return 'pythonanywhere' in socket.gethostname().lower()
+        except OSError:
+            return False
     
     @staticmethod
     def is_docker() -> bool:
@@ -119,7 +123,7 @@ class Settings(BaseSettings):
     """
     
     # Environment (auto-detected if not set)
-    environment: str = EnvironmentDetector.detect()
+    environment: str = Field(default_factory=EnvironmentDetector.detect)
     
     # MongoDB - Required in all environments
     mongodb_url: str
@@ -128,10 +132,10 @@ class Settings(BaseSettings):
     # API Configuration - Auto-configured based on environment
     api_v3_host: str = "0.0.0.0"
     api_v3_port: int = 8000
-    api_v3_reload: bool = True  # Auto-set to False in production
+    api_v3_reload: bool = Field(default=True, validate_default=True)  # Auto-set to False in production
     
     # CORS - Auto-configured based on environment
-    cors_origins: str = ""  # Auto-populated if empty
+    cors_origins: str = ""  # Empty -> per-environment defaults (see cors_origins_list)
     
     # Google Places API
     google_places_api_key: str = ""
@@ -145,43 +149,58 @@ class Settings(BaseSettings):
     # Google OAuth - Auto-configured redirect URI
     google_oauth_client_id: str = ""
     google_oauth_client_secret: str = ""
-    google_oauth_redirect_uri: str = ""  # Auto-populated
+    google_oauth_redirect_uri: str = Field(default="", validate_default=True)  # Auto-populated
     
     # Frontend URLs - Auto-configured
-    frontend_url: str = ""  # Auto-populated
-    frontend_url_production: str = ""  # Auto-populated
+    frontend_url: str = Field(default="", validate_default=True)  # Auto-populated
+    frontend_url_production: str = Field(default="", validate_default=True)  # Auto-populated
     
     # JWT Token Settings
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 30
     
+    # Parsed once in model_post_init
+    _cors_list: Tuple[str, ...] = PrivateAttr(default=())
+    
+    @field_validator('api_v3_reload')
+    def default_reload(cls, v, info):
+        """Disable reload in production environments"""
+        if info.data.get('environment') in ['pythonanywhere', 'production']:
+            return False
+        return v
+    
+    @field_validator('google_oauth_redirect_uri')
+    def default_redirect_uri(cls, v):
+        """Auto-configure OAuth redirect URI"""
+        return v or f"{EnvironmentDetector.get_base_url()}/api/v3/auth/callback"
+    
+    @field_validator('frontend_url')
+    def default_frontend_url(cls, v, info):
+        """Auto-configure frontend URL"""
+        if v:
+            return v
+        if info.data.get('environment') == 'development':
+            return 'http://localhost:8080'
+        return EnvironmentDetector.get_frontend_url()
+    
+    @field_validator('frontend_url_production')
+    def default_frontend_url_production(cls, v):
+        """Auto-configure production frontend URL"""
+        return v or EnvironmentDetector.get_frontend_url()
+    
     def model_post_init(self, __context):
         """Auto-configure settings based on detected environment"""
         
-        # Disable reload in production environments
-        if self.environment in ['pythonanywhere', 'production']:
-            object.__setattr__(self, 'api_v3_reload', False)
-        
-        # Auto-configure OAuth redirect URI
-        if not self.google_oauth_redirect_uri:
-            base_url = EnvironmentDetector.get_base_url()
-            redirect_uri = f"{base_url}/api/v3/auth/callback"
-            object.__setattr__(self, 'google_oauth_redirect_uri', redirect_uri)
-        
-        # Auto-configure frontend URLs
-        if not self.frontend_url:
-            if self.environment == 'development':
-                object.__setattr__(self, 'frontend_url', 'http://localhost:8080')
-            else:
-                object.__setattr__(self, 'frontend_url', EnvironmentDetector.get_frontend_url())
-        
-        if not self.frontend_url_production:
-            object.__setattr__(self, 'frontend_url_production', EnvironmentDetector.get_frontend_url())
-        
-        # Auto-configure CORS origins
+        # Auto-configure CORS origins (defaults are used as-is, not re-joined)
         if not self.cors_origins:
-            origins = self._get_default_cors_origins()
-            object.__setattr__(self, 'cors_origins', ','.join(origins))
+            self._cors_list = tuple(self._get_default_cors_origins())
+            return
+        
+        # Parse CORS origins once: JSON first, then comma-separated string
+        try:
+            self._cors_list = tuple(json.loads(self.cors_origins))
+        except json.JSONDecodeError:
+            self._cors_list = tuple(origin.strip() for origin in self.cors_origins.split(',') if origin.strip())
     
     def _get_default_cors_origins(self) -> List[str]:
         """Get default CORS origins based on environment"""
@@ -213,16 +232,9 @@ class Settings(BaseSettings):
             ]
     
     @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins to list"""
-        if not self.cors_origins:
-            return self._get_default_cors_origins()
-        
-        # Handle both comma-separated and JSON formats
-        try:
-            return json.loads(self.cors_origins)
-        except:
-            return [origin.strip() for origin in self.cors_origins.split(',') if origin.strip()]
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """CORS origins parsed from comma-separated or JSON format"""
+        return self._cors_list
     
     @property
     def is_development(self) -> bool:
@@ -272,10 +284,12 @@ class Settings(BaseSettings):
             }
         else:  # production
             return {
-                'maxPoolSize': 10,
-                'minPoolSize': 2,
+                'maxPoolSize': 50,
+                'minPoolSize': 5,
                 'maxIdleTimeMS': 45000,
                 'serverSelectionTimeoutMS': 5000,
+                'waitQueueTimeoutMS': 2000,  # Fail fast instead of queueing forever when the pool is exhausted
+                'compressors': 'zstd,zlib',  # zstd needs the zstandard package; zlib is always available
             }
     
     def display_config(self) -> str:
@@ -334,6 +348,11 @@ JWT:
 # Create settings instance
 settings = Settings()
 
-# Print configuration on import (only in development)
-if settings.is_development:
+# Print configuration on import only when explicitly requested
+if os.getenv('SHOW_CONFIG') == '1':
+    print(settings.display_config())
+
+
+if __name__ == '__main__':
+    # python -m app.core.config_smart
     print(settings.display_config())
@@ -3,105 +3,269 @@ MongoDB database connection - PyMongo driver
 Follows official MongoDB documentation exactly
 """
 
-from pymongo import MongoClient
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from pymongo import IndexModel, MongoClient
+from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import OperationFailure
 from pymongo.read_preferences import ReadPreference
 import logging
+import threading
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Global client
+# Global client and database handle (set once in connect_to_mongo)
 _client: MongoClient = None
+_db: Database = None
+
+# Index builds run in a background thread; set once they have finished
+_indexes_ready = threading.Event()
+_index_thread: Optional[threading.Thread] = None
 
 
 def connect_to_mongo():
     """Connect to MongoDB - called at startup"""
-    global _client
+    global _client, _db, _index_thread
     
     logger.info("Connecting to MongoDB...")
     
-    # Per MongoDB docs: pass connection string only
-    _client = MongoClient(settings.mongodb_url)
+    # Pool options come from settings; long-running aggregations should use a
+    # separate client so they don't hold connections the request path needs
+    _client = MongoClient(
+        settings.mongodb_url,
+        maxPoolSize=settings.mongodb_max_pool_size,
+        minPoolSize=settings.mongodb_min_pool_size,
+        waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms,
+        maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+        appname="concierge-api-v3",
+    )
+    _db = _client[settings.mongodb_db_name]
     
     # Test connection
     _client.admin.command('ping')
     logger.info(f"✅ MongoDB connected: {settings.mongodb_db_name}")
     
-    # Create indexes
-    _ensure_indexes()
+    # Create indexes without holding up startup; existing indexes make this
+    # mostly a no-op, and only index-dependent queries wait for it
+    _indexes_ready.clear()
+    _index_thread = threading.Thread(target=_build_indexes_then_set_ready, name="mongo-index-build", daemon=True)
+    _index_thread.start()
 
 
 def close_mongo_connection():
     """Close MongoDB connection - called at shutdown"""
     global _client
+    if _index_thread is not None and _index_thread.is_alive():
+        # Threads can't be cancelled; give an in-flight build a moment to finish
+        _index_thread.join(timeout=5)
     if _client:
         _client.close()
         logger.info("✅ MongoDB closed")
 
 
+def wait_for_indexes(timeout: float = 30) -> bool:
+    """
+    Block until startup index creation has finished.
+    
+    Only needed by queries that cannot run without a specific index
+    (e.g. $text search). Call from sync endpoints, which run in a threadpool.
+    
+    Args:
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True if indexes are ready, False on timeout or if no build was started
+    """
+    if _index_thread is None:
+        return False
+    return _indexes_ready.wait(timeout)
+
+
+def _build_indexes_then_set_ready():
+    """Background thread target for startup index creation"""
+    try:
+        _ensure_indexes()
+    finally:
+        _indexes_ready.set()
+
+
 def get_database() -> Database:
-    """Get database instance"""
-    if _client is None:
+    """Get database instance (cached handle, no per-call Database construction)"""
+    if _db is None:
         raise RuntimeError("MongoDB not connected")
-    return _client[settings.mongodb_db_name]
+    return _db
 
 
 def _ensure_indexes():
-    """Create indexes if they don't exist"""
+    """Create indexes if they don't exist (collections are built in parallel)"""
     try:
         db = get_database()
+    except Exception as e:
+        logger.warning(f"Index creation: {e}")
+        return
+    
+    builders = {
+        "entities": _ensure_entity_indexes,
+        "curations": _ensure_curation_indexes,
+        "capture_sessions": _ensure_capture_session_indexes,
+        "categories": _ensure_category_indexes,
+    }
+    
+    # PyMongo clients are thread-safe; each collection's index round-trips
+    # run on their own pooled connection instead of one after another
+    with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+        futures = {name: executor.submit(builder, db) for name, builder in builders.items()}
+    
+    failed = False
+    for name, future in futures.items():
+        error = future.exception()
+        if error is not None:
+            failed = True
+            logger.warning(f"Index creation ({name}): {error}")
+    
+    if not failed:
+        logger.info("✅ Indexes ready")
+
+
+# ── Entities collection ──────────────────────────────────────────────────────
+ENTITY_INDEXES = [
+    # Simple indexes
+    IndexModel("type"),
+    IndexModel("name"),
+    IndexModel("createdAt"),
+    IndexModel([("name", "text")]),
+
+    # Uniqueness guards
+    IndexModel("externalId", unique=True, sparse=True),
+    IndexModel("data.place_id", unique=True, sparse=True),
+
+    # Composite indexes for scale
+    # Supports: list with status filter + incremental sync (?since)
+    IndexModel([("status", 1), ("updatedAt", -1)]),
+    # Supports: stable cursor-based pagination on large collections
+    IndexModel([("updatedAt", -1), ("_id", 1)]),
+    # Supports: type filter combined with status
+    IndexModel([("type", 1), ("status", 1)]),
+]
+
+# ── Curations collection ─────────────────────────────────────────────────────
+CURATION_INDEXES = [
+    # Simple indexes
+    IndexModel("entity_id"),
+    IndexModel("curator.id"),
+    IndexModel("createdAt"),
+    IndexModel("city"),
+    IndexModel("type"),
+
+    # Composite indexes for scale
+    # Supports: status filter + incremental sync (?since)
+    IndexModel([("status", 1), ("updatedAt", -1)]),
+    # Supports: curations per entity excluding deleted (most common query)
+    IndexModel([("entity_id", 1), ("status", 1)]),
+    # Supports: curations per curator with status filter
+    IndexModel([("curator.id", 1), ("status", 1)]),
+    # Supports: stable cursor-based pagination on large collections
+    IndexModel([("updatedAt", -1), ("_id", 1)]),
+]
 
-        # ── Entities collection ──────────────────────────────────────────────
-        # Simple indexes
-        db.entities.create_index("type", background=True)
-        db.entities.create_index("name", background=True)
-        db.entities.create_index("createdAt", background=True)
-        db.entities.create_index([("name", "text")], background=True)
-
-        # Uniqueness guards
-        db.entities.create_index("externalId", unique=True, sparse=True, background=True)
-        db.entities.create_index("data.place_id", unique=True, sparse=True, background=True)
-
-        # Composite indexes for scale
-        # Supports: list with status filter + incremental sync (?since)
-        db.entities.create_index([("status", 1), ("updatedAt", -1)], background=True)
-        # Supports: stable cursor-based pagination on large collections
-        db.entities.create_index([("updatedAt", -1), ("_id", 1)], background=True)
-        # Supports: type filter combined with status
-        db.entities.create_index([("type", 1), ("status", 1)], background=True)
-
-        # ── Curations collection ─────────────────────────────────────────────
-        # Drop legacy unique index on entity_id if it exists
+# ── Capture sessions collection ──────────────────────────────────────────────
+CAPTURE_SESSION_INDEXES = [
+    # TTL: auto-delete sessions after 48h
+    IndexModel("createdAt", expireAfterSeconds=172800),
+]
+
+# ── Categories collection ────────────────────────────────────────────────────
+CATEGORY_INDEXES = [
+    # Supports: active category lookups per entity type (CategoryService)
+    IndexModel([("entity_type", 1), ("active", 1)]),
+]
+
+
+def _find_index_conflicts(indexes: List[IndexModel], existing: Dict[str, Any]) -> List[str]:
+    """
+    Find existing indexes whose options differ from the desired spec.
+    
+    Index names encode the key pattern, so a name match with different
+    options (e.g. a legacy unique index) means the index must be rebuilt.
+    """
+    conflicts = []
+    for index in indexes:
+        name = index.document["name"]
+        current = existing.get(name)
+        if current is None:
+            continue
+        if (
+            bool(current.get("unique")) != bool(index.document.get("unique"))
+            or bool(current.get("sparse")) != bool(index.document.get("sparse"))
+            or current.get("expireAfterSeconds") != index.document.get("expireAfterSeconds")
+        ):
+            conflicts.append(name)
+    return conflicts
+
+
+def _create_missing_indexes(collection: Collection, indexes: List[IndexModel], existing: Dict[str, Any]) -> int:
+    """
+    Create only the indexes whose names are not already on the collection.
+    
+    Indexes with conflicting options are dropped first (one dropIndexes
+    command) and rebuilt with the rest of the batch.
+    
+    Args:
+        collection: Target collection
+        indexes: Desired index specs
+        existing: Current index_information() of the collection
+        
+    Returns:
+        Number of indexes created
+    """
+    conflicts = _find_index_conflicts(indexes, existing)
+    if conflicts:
+        logger.warning(f"Rebuilding indexes on {collection.name} with changed options: {conflicts}")
+        collection.database.command("dropIndexes", collection.name, index=conflicts)
+        existing = {name: meta for name, meta in existing.items() if name not in conflicts}
+    
+    missing = [index for index in indexes if index.document["name"] not in existing]
+    if not missing:
+        return 0
+    
+    # One createIndexes command for the whole batch
+    try:
+        collection.create_indexes(missing)
+        return len(missing)
+    except OperationFailure as e:
+        logger.warning(f"Batch index creation on {collection.name} failed ({e}); retrying one by one")
+    
+    # A single bad spec fails the whole batch - create the rest individually
+    created = 0
+    for index in missing:
         try:
-            indexes = db.curations.index_information()
-            for name, meta in indexes.items():
-                if "key" in meta and meta["key"] == [("entity_id", 1)] and meta.get("unique") is True:
-                    logger.warning(f"Found legacy unique index '{name}' on entity_id - Dropping...")
-                    db.curations.drop_index(name)
-                    logger.info("✅ Dropped legacy unique index")
-                    break
-        except Exception as e:
-            logger.warning(f"Error checking legacy indexes: {e}")
-
-        # Simple indexes
-        db.curations.create_index("entity_id", background=True)
-        db.curations.create_index("curator.id", background=True)
-        db.curations.create_index("createdAt", background=True)
-        db.curations.create_index("city", background=True)
-        db.curations.create_index("type", background=True)
-
-        # Composite indexes for scale
-        # Supports: status filter + incremental sync (?since)
-        db.curations.create_index([("status", 1), ("updatedAt", -1)], background=True)
-        # Supports: curations per entity excluding deleted (most common query)
-        db.curations.create_index([("entity_id", 1), ("status", 1)], background=True)
-        # Supports: curations per curator with status filter
-        db.curations.create_index([("curator.id", 1), ("status", 1)], background=True)
-        # Supports: stable cursor-based pagination on large collections
-        db.curations.create_index([("updatedAt", -1), ("_id", 1)], background=True)
+            collection.create_indexes([index])
+            created += 1
+        except OperationFailure as e:
+            logger.warning(f"Index {index.document['name']} on {collection.name}: {e}")
+    return created
 
-        logger.info("✅ Indexes ready")
-    except Exception as e:
-        logger.warning(f"Index creation: {e}")
+
+def _ensure_entity_indexes(db: Database):
+    """Create indexes on the entities collection"""
+    _create_missing_indexes(db.entities, ENTITY_INDEXES, db.entities.index_information())
+
+
+def _ensure_curation_indexes(db: Database):
+    """Create indexes on the curations collection"""
+    # A legacy unique index on entity_id is rebuilt as non-unique via the conflict path
+    _create_missing_indexes(db.curations, CURATION_INDEXES, db.curations.index_information())
+
+
+def _ensure_capture_session_indexes(db: Database):
+    """Create indexes on the capture_sessions collection"""
+    collection = db["capture_sessions"]
+    _create_missing_indexes(collection, CAPTURE_SESSION_INDEXES, collection.index_information())
+
+
+def _ensure_category_indexes(db: Database):
+    """Create indexes on the categories collection"""
+    _create_missing_indexes(db.categories, CATEGORY_INDEXES, db.categories.index_information())
@@ -9,7 +9,8 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Connect to MongoDB, create indexes, and warm caches on startup."""
-    from app.core.database import connect_to_mongo, close_mongo_connection, get_database
+    from app.core.database import connect_to_mongo, close_mongo_connection
+    from app.services.http_client import close_http_client
 
     # Startup
     try:
@@ -18,21 +19,14 @@ async def lifespan(app: FastAPI):
         print(f"⚠️  MongoDB connection failed (continuing without it): {e}")
         print("⚠️  Only Places API endpoints will work")
         yield
+        await close_http_client()
         return
 
-    db = get_database()
-
-    # Ensure TTL index on capture_sessions (auto-delete after 48h)
-    try:
-        db["capture_sessions"].create_index(
-            "createdAt", expireAfterSeconds=172800, background=True
-        )
-        logger.info("capture_sessions TTL index ensured")
-    except Exception as e:
-        logger.warning(f"Failed to create capture_sessions TTL index: {e}")
+    # Indexes (including the capture_sessions TTL) build in the background
 
     yield  # App runs here
 
     # Shutdown
     close_mongo_connection()
+    await close_http_client()
     logger.info("Shutting down")
@@ -3,16 +3,22 @@ Security module for API authentication
 Implements both API Key and JWT OAuth authentication
 """
 
+import hashlib
+import logging
 import os
 import secrets
-from typing import Optional
-from datetime import datetime, timedelta, timezone
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+from datetime import timedelta
 from fastapi import Security, HTTPException, status, Depends
 from fastapi.security import APIKeyHeader, HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 # API Key header configuration
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -24,11 +30,23 @@ bearer_scheme = HTTPBearer(auto_error=False)
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hour
 REFRESH_TOKEN_EXPIRE_DAYS = 30  # 30 days
+# exp/iat are written as integer epoch seconds (JWT NumericDate)
+_ACCESS_TOKEN_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+# Decoded access tokens: {blake2b(token): (payload, cached_at)}
+# Only tokens valid for longer than the TTL are cached, so a hit never outlives exp
+TOKEN_CACHE_TTL = 60  # seconds
+TOKEN_CACHE_MAX_ENTRIES = 10000
+_token_cache: Dict[bytes, tuple] = {}
 
 
+@lru_cache(maxsize=1)
 def get_api_secret_key() -> str:
     """
-    Get API secret key from settings.
+    Get API secret key from settings (resolved once, then cached).
+    
+    A missing key is not cached, so the error is raised on every call.
     
     Returns:
         str: API secret key
@@ -45,6 +63,66 @@ def get_api_secret_key() -> str:
     return api_key
 
 
+@lru_cache(maxsize=4)
+def _build_jwt_key(secret_key: str):
+    """Construct the HMAC key object for a secret (cached per secret)"""
+    return jwk.construct(secret_key, ALGORITHM)
+
+
+@lru_cache(maxsize=4)
+def _secret_bytes(secret_key: str) -> bytes:
+    """Encode a secret for byte-wise comparison (cached per secret)"""
+    return secret_key.encode("utf-8")
+
+
+def get_jwt_key():
+    """
+    Get the JWT signing/verification key.
+    
+    python-jose rebuilds an HMAC key from a raw string on every encode/decode;
+    passing a prebuilt key object skips that work.
+    
+    Raises:
+        RuntimeError: If API_SECRET_KEY is not configured
+    """
+    return _build_jwt_key(get_api_secret_key())
+
+
+def reload_secret() -> None:
+    """Drop the cached API secret key (for key rotation and tests)"""
+    get_api_secret_key.cache_clear()
+    _build_jwt_key.cache_clear()
+    _secret_bytes.cache_clear()
+    _token_cache.clear()
+
+
+def _cache_token_payload(digest: bytes, payload: dict, now: float) -> None:
+    """Remember a decoded access token if it stays valid for the whole TTL"""
+    exp = payload.get("exp")
+    if not exp or exp - now <= TOKEN_CACHE_TTL:
+        return
+    
+    while len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        del _token_cache[next(iter(_token_cache))]
+    
+    _token_cache[digest] = (payload, now)
+
+
+def _key_matches(api_key: str) -> bool:
+    """
+    Constant-time comparison of an API key against the configured secret.
+    
+    Compares bytes: the secret is encoded once per value, and non-ASCII
+    header values simply fail to match instead of raising TypeError.
+    
+    Raises:
+        RuntimeError: If API_SECRET_KEY is not configured
+    """
+    expected = _secret_bytes(get_api_secret_key())
+    return secrets.compare_digest(api_key.encode("utf-8"), expected)
+
+
 async def verify_api_key(api_key: Optional[str] = Security(api_key_header)) -> str:
     """
     Verify API key from request header.
@@ -73,15 +151,14 @@ async def verify_api_key(api_key: Optional[str] = Security(api_key_header)) -> s
         )
     
     try:
-        expected_key = get_api_secret_key()
+        matches = _key_matches(api_key)
     except RuntimeError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
     
-    # Use secrets.compare_digest to prevent timing attacks
-    if not secrets.compare_digest(api_key, expected_key):
+    if not matches:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key",
@@ -110,12 +187,12 @@ async def optional_api_key(api_key: Optional[str] = Security(api_key_header)) ->
         return None
     
     try:
-        expected_key = get_api_secret_key()
+        matches = _key_matches(api_key)
     except RuntimeError:
         # If API_SECRET_KEY not configured, allow public access
         return None
     
-    if not secrets.compare_digest(api_key, expected_key):
+    if not matches:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key",
@@ -151,17 +228,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         str: Encoded JWT token
     """
     to_encode = data.copy()
+    now = int(time.time())
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_SECONDS
+    expire = now + lifetime
     
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
+    to_encode.update({"exp": expire, "iat": now})
     
     # Use API secret key as JWT secret
-    secret_key = get_api_secret_key()
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, get_jwt_key(), algorithm=ALGORITHM)
     
     return encoded_jwt
 
@@ -177,16 +251,15 @@ def create_refresh_token(data: dict) -> str:
         str: Encoded JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    now = int(time.time())
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _REFRESH_TOKEN_SECONDS,
+        "iat": now,
         "type": "refresh"  # Distinguish from access tokens
     })
     
     # Use API secret key as JWT secret
-    secret_key = get_api_secret_key()
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, get_jwt_key(), algorithm=ALGORITHM)
     
     return encoded_jwt
 
@@ -204,12 +277,9 @@ async def verify_refresh_token(token: str) -> dict:
     Raises:
         HTTPException: 401 if token is invalid or expired
     """
-    import logging
-    logger = logging.getLogger(__name__)
     
     try:
-        secret_key = get_api_secret_key()
-        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, get_jwt_key(), algorithms=[ALGORITHM])
         
         # Verify it's a refresh token
         if payload.get("type") != "refresh":
@@ -220,23 +290,17 @@ async def verify_refresh_token(token: str) -> dict:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Check expiration
-        exp = payload.get("exp")
-        if exp:
-            exp_time = datetime.fromtimestamp(exp, tz=timezone.utc)
-            now = datetime.now(timezone.utc)
-            
-            if now > exp_time:
-                logger.warning("[Refresh Token] Token expired")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Refresh token expired",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-        
-        logger.info("[Refresh Token] ✓ Valid")
+        logger.debug("[Refresh Token] ✓ Valid sub=%s", payload.get("sub"))
         return payload
         
+    except ExpiredSignatureError:
+        # jwt.decode validates exp itself
+        logger.warning("[Refresh Token] Token expired")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token expired",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     except JWTError as e:
         logger.error(f"[Refresh Token] JWT Error: {str(e)}")
         raise HTTPException(
@@ -261,13 +325,11 @@ async def verify_access_token(
     Raises:
         HTTPException: 401 if token is missing or invalid
     """
-    import logging
-    logger = logging.getLogger(__name__)
     
     # Test mode bypass — ONLY in development, NEVER in production.
     # Guards against accidentally leaving TESTING=true in deployed environments.
     if os.getenv("TESTING") == "true" and settings.environment == "development":
-        logger.info("[Token Verify] TEST MODE - bypassing auth (development only)")
+        logger.debug("[Token Verify] TEST MODE - bypassing auth (development only)")
         return {
             "sub": "test@example.com",
             "email": "test@example.com",
@@ -275,9 +337,6 @@ async def verify_access_token(
             "picture": "https://example.com/avatar.jpg"
         }
     
-    logger.info("[Token Verify] ========================================")
-    logger.info(f"[Token Verify] Credentials present: {credentials is not None}")
-    
     if not credentials:
         logger.warning("[Token Verify] ✗ Missing authorization token")
         raise HTTPException(
@@ -287,36 +346,32 @@ async def verify_access_token(
         )
     
     token = credentials.credentials
-    logger.info(f"[Token Verify] Token: {token[:20]}...")
+    
+    # Reuse a recent decode of the same token instead of re-verifying the HMAC
+    now = time.time()
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(digest)
+    if cached is not None:
+        payload, cached_at = cached
+        if now - cached_at < TOKEN_CACHE_TTL:
+            return payload
+        del _token_cache[digest]
     
     try:
-        secret_key = get_api_secret_key()
-        logger.info("[Token Verify] Decoding token...")
-        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
-        
-        logger.info(f"[Token Verify] ✓ Token decoded")
-        logger.info(f"[Token Verify]   sub: {payload.get('sub')}")
-        logger.info(f"[Token Verify]   exp: {payload.get('exp')}")
+        payload = jwt.decode(token, get_jwt_key(), algorithms=[ALGORITHM])
+        _cache_token_payload(digest, payload, now)
         
-        # Check expiration
-        exp = payload.get("exp")
-        if exp:
-            exp_time = datetime.fromtimestamp(exp, tz=timezone.utc)
-            now = datetime.now(timezone.utc)
-            logger.info(f"[Token Verify]   now: {now}")
-            logger.info(f"[Token Verify]   exp_time: {exp_time}")
-            
-            if now > exp_time:
-                logger.warning("[Token Verify] ✗ Token expired")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token expired",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-        
-        logger.info("[Token Verify] ✓ Token valid")
+        logger.debug("[Token Verify] ✓ Token valid sub=%s exp=%s", payload.get("sub"), payload.get("exp"))
         return payload
         
+    except ExpiredSignatureError:
+        # jwt.decode validates exp itself
+        logger.warning("[Token Verify] ✗ Token expired")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token expired",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     except JWTError as e:
         logger.error(f"[Token Verify] ✗ JWT Error: {str(e)}")
         raise HTTPException(
@@ -344,14 +399,11 @@ def verify_auth(
     Raises HTTPException(401) if neither credential is valid.
     Raises HTTPException(500) if API_SECRET_KEY is not configured.
     """
-    import logging
-    logger = logging.getLogger(__name__)
 
     # Try API key first
     if api_key:
         try:
-            expected_key = get_api_secret_key()
-            if secrets.compare_digest(api_key, expected_key):
+            if _key_matches(api_key):
                 return {"authenticated": True, "method": "api_key"}
         except RuntimeError:
             # API_SECRET_KEY not configured — surface to operators
@@ -366,7 +418,7 @@ def verify_auth(
     # Try JWT Bearer token
     if bearer:
         try:
-            payload = jwt.decode(bearer.credentials, get_api_secret_key(), algorithms=[ALGORITHM])
+            payload = jwt.decode(bearer.credentials, get_jwt_key(), algorithms=[ALGORITHM])
             return {
                 "authenticated": True,
                 "method": "jwt",
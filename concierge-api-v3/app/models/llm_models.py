@@ -9,7 +9,7 @@ These models provide a unified, LLM-friendly view of restaurant data,
 consolidating information from Google Places, Michelin, entities, and curations.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -26,6 +26,8 @@ class LLMRestaurantGeo(BaseModel):
     state: Optional[str] = Field(None, description="State/region")
     country: Optional[str] = Field(None, description="Country code (e.g., BR, US)")
     postal_code: Optional[str] = Field(None, description="Postal/ZIP code")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantStatus(BaseModel):
@@ -35,12 +37,16 @@ class LLMRestaurantStatus(BaseModel):
     weekend_days_open: Optional[List[str]] = Field(None, description="Which weekend days are open (e.g., ['saturday', 'sunday'])")
     supports_reservation: Optional[bool] = Field(None, description="Whether reservations are supported")
     business_status: Optional[str] = Field(None, description="Business operational status (e.g., OPERATIONAL, CLOSED)")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantHoursPeriod(BaseModel):
     """Single opening/closing period"""
     open: str = Field(..., description="Opening time in HH:MM format")
     close: str = Field(..., description="Closing time in HH:MM format")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantOpeningHours(BaseModel):
@@ -52,6 +58,8 @@ class LLMRestaurantOpeningHours(BaseModel):
         description="Regular hours by day of week"
     )
     notes: Optional[List[str]] = Field(None, description="Additional notes about hours")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantMichelin(BaseModel):
@@ -63,6 +71,8 @@ class LLMRestaurantMichelin(BaseModel):
     comment: Optional[str] = Field(None, description="Michelin guide comment/description")
     cuisine: Optional[str] = Field(None, description="Cuisine type from Michelin")
     price: Optional[str] = Field(None, description="Price level from Michelin")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantCurationSource(BaseModel):
@@ -70,6 +80,8 @@ class LLMRestaurantCurationSource(BaseModel):
     curator_id: str = Field(..., description="Curator identifier")
     curator_name: Optional[str] = Field(None, description="Curator display name")
     strength: Optional[str] = Field(None, description="Recommendation strength (e.g., strong, medium, weak)")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantCuration(BaseModel):
@@ -78,6 +90,8 @@ class LLMRestaurantCuration(BaseModel):
     avoid_for: Optional[List[str]] = Field(None, description="Situations to avoid (e.g., ['large-groups'])")
     highlights: Optional[List[str]] = Field(None, description="Key highlights from curators")
     sources: Optional[List[LLMRestaurantCurationSource]] = Field(None, description="Curation sources")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantScores(BaseModel):
@@ -85,6 +99,8 @@ class LLMRestaurantScores(BaseModel):
     google_rating: Optional[float] = Field(None, description="Google rating (0-5)")
     google_reviews_count: Optional[int] = Field(None, description="Number of Google reviews")
     internal_quality_score: Optional[float] = Field(None, description="Internal quality score (0-1)")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMRestaurantSnapshot(BaseModel):
@@ -95,7 +111,7 @@ class LLMRestaurantSnapshot(BaseModel):
     # Core identifiers
     entity_id: Optional[str] = Field(None, description="Internal entity ID")
     place_id: Optional[str] = Field(None, description="Google Place ID")
-    external_refs: Optional[Dict[str, Any]] = Field(None, description="External reference IDs")
+    external_refs: Any = Field(None, description="External reference IDs (passthrough, not validated)")
     
     # Basic information
     name: str = Field(..., description="Restaurant name")
@@ -120,7 +136,10 @@ class LLMRestaurantSnapshot(BaseModel):
     price_level: Optional[str] = Field(None, description="Price level (e.g., MODERATE, EXPENSIVE)")
     
     # Raw sources (optional, for debugging or advanced use)
-    raw_sources: Optional[Dict[str, Any]] = Field(None, description="Raw data from sources")
+    # Typed Any so pydantic passes the blob through instead of walking every key
+    raw_sources: Any = Field(None, description="Raw data from sources (passthrough, not validated)")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 # ============================================================================
@@ -149,13 +168,17 @@ class LLMSearchRestaurantItem(BaseModel):
     has_entity: bool = Field(False, description="Whether this place has an entity record")
     has_michelin_data: bool = Field(False, description="Whether this place has Michelin data")
     michelin: Optional[LLMRestaurantMichelin] = Field(None, description="Basic Michelin info if available")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMSearchRestaurantsResponse(BaseModel):
     """Response from restaurant search"""
     items: List[LLMSearchRestaurantItem] = Field(..., description="Search results")
     total_results: int = Field(..., description="Number of results returned")
-    search_metadata: Optional[Dict[str, Any]] = Field(None, description="Additional search metadata")
+    search_metadata: Any = Field(None, description="Additional search metadata (passthrough, not validated)")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # ============================================================================
@@ -182,7 +205,9 @@ class LLMGetRestaurantSnapshotResponse(BaseModel):
     """Response with complete restaurant snapshot"""
     snapshot: LLMRestaurantSnapshot = Field(..., description="Complete restaurant data")
     sources_used: List[str] = Field(..., description="List of data sources used")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    metadata: Any = Field(None, description="Additional metadata (passthrough, not validated)")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # ============================================================================
@@ -210,6 +235,8 @@ class LLMDayAvailability(BaseModel):
     """Availability for a specific day"""
     is_open: bool = Field(..., description="Whether the place is open on this day")
     periods: List[LLMRestaurantHoursPeriod] = Field(..., description="Opening periods for this day")
+    
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class LLMGetRestaurantAvailabilityResponse(BaseModel):
@@ -234,3 +261,44 @@ class LLMGetRestaurantAvailabilityResponse(BaseModel):
     # Additional notes
     notes: Optional[List[str]] = Field(None, description="Additional availability notes")
     timezone: Optional[str] = Field(None, description="Timezone used for calculations")
+    
+    model_config = ConfigDict(frozen=True)
+
+
+# ============================================================================
+# GET RESTAURANT BUNDLE
+# ============================================================================
+
+class LLMGetRestaurantBundleRequest(BaseModel):
+    """Request to search and fetch snapshot + availability in one call"""
+    query: str = Field(..., description="Restaurant name or search query")
+    latitude: Optional[float] = Field(None, description="Latitude for location bias")
+    longitude: Optional[float] = Field(None, description="Longitude for location bias")
+    radius_m: int = Field(5000, description="Search radius in meters", ge=100, le=50000)
+    max_results: int = Field(5, description="Maximum number of results", ge=1, le=20)
+    language: str = Field("pt-BR", description="Language code for results")
+    region: str = Field("BR", description="Region code for results")
+    
+    # Sections to resolve for the top result
+    include_snapshot: bool = Field(True, description="Include snapshot of the top result")
+    include_availability: bool = Field(True, description="Include availability of the top result")
+    
+    timezone: str = Field("America/Sao_Paulo", description="Timezone for time calculations")
+    weekend_days: List[str] = Field(
+        ["saturday", "sunday"],
+        description="Days considered as weekend"
+    )
+
+
+class LLMGetRestaurantBundleResponse(BaseModel):
+    """Search results plus snapshot and availability of the top result"""
+    items: List[LLMSearchRestaurantItem] = Field(..., description="Search results")
+    total_results: int = Field(..., description="Number of results returned")
+    snapshot: Optional[LLMRestaurantSnapshot] = Field(None, description="Complete data for the top result")
+    availability: Optional[LLMGetRestaurantAvailabilityResponse] = Field(
+        None,
+        description="Availability for the top result"
+    )
+    sources_used: List[str] = Field(default_factory=list, description="Data sources used for the snapshot")
+    
+    model_config = ConfigDict(frozen=True)
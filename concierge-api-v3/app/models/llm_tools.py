@@ -7,11 +7,93 @@ Last Updated: November 21, 2025
 This module defines the tool schemas for Model Context Protocol (MCP) integration.
 These schemas allow LLMs like Claude to discover and use the LLM Gateway endpoints
 as tools for restaurant search and information retrieval.
+
+The schemas are static, so each accessor builds its dict once and returns the
+same cached object afterwards. Callers must treat the results as read-only.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List
 
 
+# ============================================================================
+# TOOL DESCRIPTIONS
+# ============================================================================
+
+# Tools carry a one-paragraph summary by default; the example lists are only
+# sent when a client asks for the verbose listing (they cost prompt tokens on
+# every LLM call that registers the tools).
+
+_SEARCH_RESTAURANTS_DESCRIPTION = (
+    "Search for restaurants by name or query. "
+    "Returns candidates with place_id and entity_id for use with "
+    "get_restaurant_snapshot or get_restaurant_availability."
+)
+
+_RESTAURANT_SNAPSHOT_DESCRIPTION = (
+    "Get complete, consolidated information about a specific restaurant. "
+    "This is the PRIMARY tool for detailed questions about a restaurant. "
+    "You must provide either place_id OR entity_id (from search results)."
+)
+
+_RESTAURANT_AVAILABILITY_DESCRIPTION = (
+    "Get restaurant availability and opening hours. "
+    "SPECIALIZED tool for hours questions; for anything broader use get_restaurant_snapshot. "
+    "You must provide either place_id OR entity_id (from search results)."
+)
+
+_RESTAURANT_BUNDLE_DESCRIPTION = (
+    "Search for a restaurant and get the snapshot and availability of the best match in one call. "
+    "Prefer this over chaining search_restaurants, get_restaurant_snapshot and "
+    "get_restaurant_availability when the user names a single restaurant."
+)
+
+# Appended to the summaries above in verbose mode, keyed by tool name
+_TOOL_DESCRIPTION_DETAILS = {
+    "search_restaurants": (
+        "\n\n"
+        "Example use cases:\n"
+        "- 'Tell me about Dom Manolo restaurant'\n"
+        "- 'Find Italian restaurants near me'\n"
+        "- 'Is there a restaurant called Figueira Rubaiyat?'"
+    ),
+    "get_restaurant_snapshot": (
+        "\n\n"
+        "The snapshot includes:\n"
+        "- Basic info (name, address, phone, website) and coordinates\n"
+        "- Opening hours by day and current open/closed status\n"
+        "- Google ratings, review counts, price level and place types\n"
+        "- Michelin data (if available - stars, Bib Gourmand, cuisine)\n"
+        "- Curated tags and highlights from experts\n"
+        "\n"
+        "Example use cases:\n"
+        "- 'Tell me about this restaurant'\n"
+        "- 'Does it have a Michelin star?'\n"
+        "- 'How do I contact them?'"
+    ),
+    "get_restaurant_availability": (
+        "\n\n"
+        "Provides:\n"
+        "- Current open/closed status\n"
+        "- Weekend availability (which days)\n"
+        "- Detailed hours by day of week\n"
+        "- Human-readable notes about availability\n"
+        "\n"
+        "Example use cases:\n"
+        "- 'Is it open right now?'\n"
+        "- 'Is this restaurant open on Saturday?'\n"
+        "- 'What days is it closed?'"
+    ),
+    "get_restaurant_bundle": (
+        "\n\n"
+        "Example use cases:\n"
+        "- 'Is Dom Manolo open on Saturday?'\n"
+        "- 'Tell me about Figueira Rubaiyat'"
+    ),
+}
+
+
+@lru_cache(maxsize=1)
 def get_search_restaurants_tool() -> Dict[str, Any]:
     """
     Tool schema for searching restaurants.
@@ -25,19 +107,7 @@ def get_search_restaurants_tool() -> Dict[str, Any]:
     """
     return {
         "name": "search_restaurants",
-        "description": (
-            "Search for restaurants by name or query. "
-            "Use this tool when you need to find restaurants matching a user's query. "
-            "Returns a list of candidate restaurants with place_id and entity_id that can be used "
-            "for detailed queries with get_restaurant_snapshot or get_restaurant_availability. "
-            "\n\n"
-            "Example use cases:\n"
-            "- User asks: 'Tell me about Dom Manolo restaurant'\n"
-            "- User asks: 'Find Italian restaurants near me'\n"
-            "- User asks: 'Is there a restaurant called Figueira Rubaiyat?'\n"
-            "\n"
-            "After getting results, use place_id or entity_id to fetch detailed information."
-        ),
+        "description": _SEARCH_RESTAURANTS_DESCRIPTION,
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -83,6 +153,7 @@ def get_search_restaurants_tool() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_restaurant_snapshot_tool() -> Dict[str, Any]:
     """
     Tool schema for getting complete restaurant information.
@@ -95,35 +166,7 @@ def get_restaurant_snapshot_tool() -> Dict[str, Any]:
     """
     return {
         "name": "get_restaurant_snapshot",
-        "description": (
-            "Get complete, consolidated information about a specific restaurant. "
-            "This is the PRIMARY tool for answering detailed questions about a restaurant. "
-            "\n\n"
-            "The snapshot includes:\n"
-            "- Basic info (name, address, phone, website)\n"
-            "- Geographic coordinates\n"
-            "- Opening hours by day of week\n"
-            "- Current open/closed status\n"
-            "- Google ratings and review counts\n"
-            "- Michelin data (if available - stars, Bib Gourmand, cuisine)\n"
-            "- Curated tags and highlights from experts\n"
-            "- Price level and place types\n"
-            "\n"
-            "Use this tool when:\n"
-            "- User asks for details about a specific restaurant\n"
-            "- User asks about hours, ratings, contact info\n"
-            "- User wants comprehensive information\n"
-            "- You need context to make recommendations\n"
-            "\n"
-            "Example use cases:\n"
-            "- 'Tell me about this restaurant'\n"
-            "- 'What are the opening hours?'\n"
-            "- 'Does it have a Michelin star?'\n"
-            "- 'How do I contact them?'\n"
-            "- 'What's the price range?'\n"
-            "\n"
-            "IMPORTANT: You must provide either place_id OR entity_id (from search results)."
-        ),
+        "description": _RESTAURANT_SNAPSHOT_DESCRIPTION,
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -168,6 +211,7 @@ def get_restaurant_snapshot_tool() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_restaurant_availability_tool() -> Dict[str, Any]:
     """
     Tool schema for getting restaurant availability and hours.
@@ -180,32 +224,7 @@ def get_restaurant_availability_tool() -> Dict[str, Any]:
     """
     return {
         "name": "get_restaurant_availability",
-        "description": (
-            "Get restaurant availability and opening hours information. "
-            "This is a SPECIALIZED tool for answering availability questions. "
-            "\n\n"
-            "Provides:\n"
-            "- Current open/closed status\n"
-            "- Weekend availability (which days)\n"
-            "- Detailed hours by day of week\n"
-            "- Human-readable notes about availability\n"
-            "\n"
-            "Use this tool when:\n"
-            "- User asks 'Is it open now?'\n"
-            "- User asks 'Does it open on weekends?'\n"
-            "- User asks 'What are the weekend hours?'\n"
-            "- User asks 'Is it open on Saturday?'\n"
-            "- You need to check specific day availability\n"
-            "\n"
-            "Example use cases:\n"
-            "- 'Is this restaurant open on Saturday?'\n"
-            "- 'Does it open for weekend brunch?'\n"
-            "- 'What days is it closed?'\n"
-            "- 'Is it open right now?'\n"
-            "\n"
-            "NOTE: For comprehensive restaurant info, use get_restaurant_snapshot instead. "
-            "Use this tool only when the question is specifically about hours/availability."
-        ),
+        "description": _RESTAURANT_AVAILABILITY_DESCRIPTION,
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -248,39 +267,105 @@ def get_restaurant_availability_tool() -> Dict[str, Any]:
     }
 
 
-def get_all_tools() -> List[Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def get_restaurant_bundle_tool() -> Dict[str, Any]:
     """
-    Get all available MCP tools.
+    Tool schema for search + snapshot + availability in one call.
+    
+    Aggregates the usual three-tool chain for the top search result so the
+    LLM needs a single round-trip.
+    
+    Returns:
+        MCP tool schema dictionary
+    """
+    return {
+        "name": "get_restaurant_bundle",
+        "description": _RESTAURANT_BUNDLE_DESCRIPTION,
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Restaurant name or search term (e.g., 'D.O.M', 'Dom Manolo')"
+                },
+                "latitude": {
+                    "type": "number",
+                    "description": "Optional latitude for location-biased search (e.g., -23.5505)"
+                },
+                "longitude": {
+                    "type": "number",
+                    "description": "Optional longitude for location-biased search (e.g., -46.6333)"
+                },
+                "include_snapshot": {
+                    "type": "boolean",
+                    "description": "Include snapshot of the top result (default: true)",
+                    "default": True
+                },
+                "include_availability": {
+                    "type": "boolean",
+                    "description": "Include availability of the top result (default: true)",
+                    "default": True
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone for time calculations (default: 'America/Sao_Paulo')",
+                    "default": "America/Sao_Paulo"
+                }
+            },
+            "required": ["query"]
+        }
+    }
+
+
+@lru_cache(maxsize=2)
+def get_all_tools(verbose: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get all available MCP tools (cached, read-only).
+    
+    Args:
+        verbose: Append example use cases to each tool description
     
     Returns:
         List of all tool schema dictionaries
     """
-    return [
+    tools = [
         get_search_restaurants_tool(),
         get_restaurant_snapshot_tool(),
-        get_restaurant_availability_tool()
+        get_restaurant_availability_tool(),
+        get_restaurant_bundle_tool()
     ]
+    
+    if verbose:
+        return [
+            {**tool, "description": tool["description"] + _TOOL_DESCRIPTION_DETAILS[tool["name"]]}
+            for tool in tools
+        ]
+    
+    return tools
 
 
+@lru_cache(maxsize=1)
 def get_tools_manifest() -> Dict[str, Any]:
     """
-    Get MCP tools manifest with metadata.
+    Get MCP tools manifest with metadata (cached, read-only).
     
     Returns:
         Complete manifest with tools and metadata
     """
+    tools = get_all_tools()
+    
     return {
         "name": "concierge-restaurant",
         "version": "1.0.0",
         "description": "Restaurant search and information tools for Concierge Collector",
         "author": "Concierge Collector",
         "homepage": "https://concierge-collector.onrender.com",
-        "tools": get_all_tools(),
+        "tools": tools,
         "metadata": {
             "api_base_url": "https://concierge-collector.onrender.com/api/v3/llm",
             "health_check": "https://concierge-collector.onrender.com/api/v3/llm/health",
             "documentation": "https://concierge-collector.onrender.com/api/v3/docs",
-            "tool_count": len(get_all_tools()),
+            "tool_count": len(tools),
             "supported_languages": ["pt-BR", "en-US"],
             "default_region": "BR",
             "data_sources": [
@@ -8,11 +8,16 @@ OpenAI-compatible models for function calling / tool use.
 Follows OpenAI API specification exactly.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Union, Literal
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
+from typing import Annotated, Optional, List, Dict, Any, Union, Literal
 from enum import Enum
 
 
+# Clients send many OpenAI params we do not implement: ignore them explicitly.
+# Instances are never mutated after validation (cached tool definitions are shared).
+OPENAI_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 # ============================================================================
 # FUNCTION/TOOL DEFINITIONS
 # ============================================================================
@@ -23,6 +28,8 @@ class FunctionParameters(BaseModel):
     properties: Dict[str, Any]
     required: Optional[List[str]] = None
     additionalProperties: bool = False  # Required for strict mode
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class FunctionDefinition(BaseModel):
@@ -31,12 +38,16 @@ class FunctionDefinition(BaseModel):
     description: str = Field(..., description="Function description")
     parameters: FunctionParameters = Field(..., description="Function parameters as JSON schema")
     strict: bool = Field(True, description="Whether to enforce strict mode")
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class Tool(BaseModel):
     """Tool definition (function)"""
     type: Literal["function"] = "function"
     function: FunctionDefinition
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 # ============================================================================
@@ -49,11 +60,22 @@ class ToolChoiceFunction(BaseModel):
     name: str
 
 
-ToolChoice = Union[
-    Literal["auto"],      # Let model decide
-    Literal["required"],  # Force at least one tool call
-    Literal["none"],      # No tool calls
-    ToolChoiceFunction    # Force specific function
+# "auto": let model decide, "required": force at least one tool call, "none": no tool calls
+ToolChoiceMode = Literal["auto", "required", "none"]
+
+
+def _tool_choice_kind(value: Any) -> str:
+    """Pick the ToolChoice variant by shape: a bare mode string or a function object"""
+    return "mode" if isinstance(value, str) else "function"
+
+
+# Discriminated by shape so validation goes straight to one variant
+ToolChoice = Annotated[
+    Union[
+        Annotated[ToolChoiceMode, Tag("mode")],
+        Annotated[ToolChoiceFunction, Tag("function")],  # Force specific function
+    ],
+    Discriminator(_tool_choice_kind),
 ]
 
 
@@ -65,12 +87,16 @@ class FunctionCall(BaseModel):
     """Function call from assistant"""
     name: str
     arguments: str  # JSON-encoded string
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class ToolCallFunction(BaseModel):
     """Function details in tool call"""
     name: str
     arguments: str  # JSON-encoded string
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class ToolCall(BaseModel):
@@ -78,6 +104,8 @@ class ToolCall(BaseModel):
     id: str
     type: Literal["function"] = "function"
     function: ToolCallFunction
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class ChatMessage(BaseModel):
@@ -87,6 +115,12 @@ class ChatMessage(BaseModel):
     name: Optional[str] = None  # For tool messages
     tool_calls: Optional[List[ToolCall]] = None  # For assistant requesting tools
     tool_call_id: Optional[str] = None  # For tool response messages
+    
+    model_config = OPENAI_MODEL_CONFIG
+
+
+# Dump a whole conversation in one pydantic-core call
+CHAT_MESSAGES_ADAPTER = TypeAdapter(List[ChatMessage])
 
 
 # ============================================================================
@@ -104,18 +138,25 @@ class ChatCompletionRequest(BaseModel):
     max_tokens: Optional[int] = None
     stream: bool = False
     # Not implementing all OpenAI params, just essentials
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 # ============================================================================
 # RESPONSE
 # ============================================================================
 
+# Responses are authored by the server from known-good values: build them with
+# model_construct() to skip validation.
+
 class ResponseMessage(BaseModel):
     """Message in response"""
     role: Literal["assistant", "tool"]
     content: Optional[str] = None
     tool_calls: Optional[List[ToolCall]] = None
     refusal: Optional[str] = None
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class Choice(BaseModel):
@@ -124,6 +165,8 @@ class Choice(BaseModel):
     message: ResponseMessage
     finish_reason: Literal["stop", "tool_calls", "length", "content_filter"] = "stop"
     logprobs: Optional[Any] = None
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class Usage(BaseModel):
@@ -131,6 +174,8 @@ class Usage(BaseModel):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class ChatCompletionResponse(BaseModel):
@@ -142,6 +187,8 @@ class ChatCompletionResponse(BaseModel):
     choices: List[Choice]
     usage: Usage
     system_fingerprint: Optional[str] = None
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 # ============================================================================
@@ -154,6 +201,8 @@ class Model(BaseModel):
     object: Literal["model"] = "model"
     created: int
     owned_by: str
+    
+    model_config = OPENAI_MODEL_CONFIG
 
 
 class ModelsResponse(BaseModel):
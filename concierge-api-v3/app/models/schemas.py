@@ -4,8 +4,13 @@ Professional data validation and serialization
 """
 
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, Field, EmailStr, ConfigDict, AliasChoices, field_validator
+from functools import partial
+from typing import Annotated, Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, AliasChoices, TypeAdapter, field_validator
+
+
+# Pre-bound default factory for timestamps (no lambda frame per instance)
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 # ============================================================================
@@ -68,8 +73,8 @@ class Entity(EntityBase):
     """Complete Entity with system fields"""
     id: str = Field(..., alias="_id")
     entity_id: str
-    createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    createdAt: datetime = Field(default_factory=_utcnow)
+    updatedAt: datetime = Field(default_factory=_utcnow)
     createdBy: Optional[str] = None
     updatedBy: Optional[str] = None
     version: int = Field(default=1, description="Optimistic locking version")
@@ -186,13 +191,18 @@ class Curation(CurationBase):
     updatedBy: Optional[str] = None
     embeddings: Optional[List[Dict]] = None
     embeddings_metadata: Optional[Dict] = None
-    createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    createdAt: datetime = Field(default_factory=_utcnow)
+    updatedAt: datetime = Field(default_factory=_utcnow)
     version: int = Field(default=1)
     
     model_config = ConfigDict(populate_by_name=True)
 
 
+# List adapters: validate a whole page of Mongo documents in one call
+ENTITY_LIST_ADAPTER = TypeAdapter(List[Entity])
+CURATION_LIST_ADAPTER = TypeAdapter(List[Curation])
+
+
 # ============================================================================
 # RESPONSE MODELS
 # ============================================================================
@@ -260,11 +270,17 @@ class BulkOperationResponse(BaseModel):
 # SEMANTIC SEARCH MODELS
 # ============================================================================
 
+# Constraint aliases shared by the search request models
+SearchQuery = Annotated[str, Field(min_length=1, max_length=500)]
+SearchLimit = Annotated[int, Field(ge=1, le=100)]
+UnitFloat = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
 class SemanticSearchRequest(BaseModel):
     """Request para busca semântica por embeddings"""
-    query: str = Field(..., min_length=1, max_length=500, description="Query text for semantic search")
-    limit: int = Field(default=10, ge=1, le=100, description="Maximum number of results")
-    min_similarity: float = Field(default=0.0, ge=0.0, le=1.0, description="Minimum cosine similarity threshold (0.0 returns all results ranked)")
+    query: SearchQuery = Field(..., description="Query text for semantic search")
+    limit: SearchLimit = Field(default=10, description="Maximum number of results")
+    min_similarity: UnitFloat = Field(default=0.0, description="Minimum cosine similarity threshold (0.0 returns all results ranked)")
     entity_types: Optional[List[str]] = Field(None, description="Filter by entity types (e.g., ['restaurant'])")
     categories: Optional[List[str]] = Field(None, description="Filter by specific categories")
     include_entity: bool = Field(default=True, description="Include entity data in response")
@@ -300,12 +316,15 @@ class SemanticSearchResponse(BaseModel):
 
 class HybridSearchRequest(BaseModel):
     """Request para busca híbrida (entities + semantic curations)"""
-    query: str = Field(..., min_length=1, max_length=500, description="Search query text")
+    query: SearchQuery = Field(..., description="Search query text")
     location: Optional[str] = Field(None, description="Location filter (city, neighborhood)")
-    limit: int = Field(default=10, ge=1, le=100, description="Maximum number of results")
-    min_similarity: float = Field(default=0.5, ge=0.0, le=1.0, description="Minimum cosine similarity for semantic matches")
+    limit: SearchLimit = Field(default=10, description="Maximum number of results")
+    min_similarity: UnitFloat = Field(default=0.5, description="Minimum cosine similarity for semantic matches")
     categories: Optional[List[str]] = Field(None, description="Filter by specific categories")
-    boost_semantic: float = Field(default=0.7, ge=0.0, le=1.0, description="Weight for semantic score (0-1)")
+    boost_semantic: UnitFloat = Field(default=0.7, description="Weight for semantic score (0-1)")
+
+
+HybridMatchType = Literal["entity", "semantic", "hybrid"]
 
 
 class HybridSearchResult(BaseModel):
@@ -314,7 +333,7 @@ class HybridSearchResult(BaseModel):
     entity: dict = Field(..., description="Entity data")
     curation: Optional[dict] = Field(None, description="Curation data if available")
     score: float = Field(..., description="Combined score (0-1)")
-    match_type: str = Field(..., description="Type of match: 'entity', 'semantic', 'hybrid'")
+    match_type: HybridMatchType = Field(..., description="Type of match: 'entity', 'semantic', 'hybrid'")
     entity_score: float = Field(default=0.0, description="Entity match score")
     semantic_score: float = Field(default=0.0, description="Semantic match score")
     semantic_matches: Optional[List[ConceptMatch]] = Field(None, description="Top semantic matches")
@@ -5,6 +5,7 @@ User Model - MongoDB Schema for OAuth-authenticated users
 from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, Literal
 from datetime import datetime, timezone
+from functools import partial
 
 # Role hierarchy (highest to lowest):
 #   admin   — full access: bulk import, delete entities, manage users
@@ -14,6 +15,8 @@ UserRole = Literal["admin", "curator", "viewer"]
 
 ROLE_HIERARCHY: dict[UserRole, int] = {"admin": 3, "curator": 2, "viewer": 1}
 
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 def has_role(user_role: UserRole, required: UserRole) -> bool:
     """Return True if user_role meets or exceeds the required role level."""
@@ -28,7 +31,7 @@ class User(BaseModel):
     picture: Optional[str] = Field(None, description="User's profile picture URL")
     authorized: bool = Field(False, description="Whether user is authorized to use the application")
     role: UserRole = Field(default="curator", description="User role: admin | curator | viewer")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Account creation timestamp")
+    created_at: datetime = Field(default_factory=_utcnow, description="Account creation timestamp")
     last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     refresh_token: Optional[str] = Field(None, description="Encrypted Google refresh token for persistent login")
 
@@ -51,6 +54,16 @@ class UserInDB(User):
     """User model with MongoDB document ID"""
     id: str = Field(..., alias="_id", description="MongoDB document ID")
 
+    @classmethod
+    def from_db(cls, doc: dict) -> "UserInDB":
+        """
+        Build from a stored users document without re-validating it.
+
+        Documents are written from validated User models, so reads skip
+        validation (model_construct); the ObjectId is converted to str.
+        """
+        return cls.model_construct(**{**doc, "_id": str(doc["_id"])})
+
 
 class OAuthTokens(BaseModel):
     """OAuth token response model"""
@@ -5,16 +5,72 @@ Combines multiple AI services (transcription, concept extraction, image analysis
 in smart workflows with flexible output control.
 """
 
+import asyncio
 import time
-import uuid
 import json
-from typing import Dict, Any, Optional
+from itertools import chain
+from secrets import token_hex
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
+from pymongo import InsertOne, UpdateOne
+
 from app.services.category_service import CategoryService
 from app.services.openai_config_service import OpenAIConfigService
 
 
+# Input flags for workflow detection, packed into one bitmask per request
+_PLACE_ID, _ENTITY_ID, _AUDIO, _IMAGE, _TEXT = 16, 8, 4, 2, 1
+
+
+def _resolve_workflow(mask: int) -> Optional[str]:
+    """Auto-detect rules for one input combination (None if insufficient)"""
+    has_place_id = bool(mask & _PLACE_ID)
+    has_entity_id = bool(mask & _ENTITY_ID)
+    has_audio = bool(mask & _AUDIO)
+    has_image = bool(mask & _IMAGE)
+    has_text = bool(mask & _TEXT)
+    
+    if has_place_id and has_audio and has_image:
+        return "place_id_with_audio_and_image"
+    elif has_place_id and has_audio:
+        return "place_id_with_audio"
+    elif has_place_id and has_image:
+        return "place_id_with_image"
+    elif has_entity_id and has_audio:
+        return "entity_id_with_audio"
+    elif has_entity_id and has_image:
+        return "entity_id_with_image"
+    elif has_audio or has_text:
+        return "audio_only"
+    elif has_image:
+        return "image_only"
+    elif has_place_id:
+        return "place_id_only"
+    return None
+
+
+# Every input combination resolved once at import, so detection is a dict lookup
+_WORKFLOW_TABLE: Dict[int, Optional[str]] = {mask: _resolve_workflow(mask) for mask in range(32)}
+
+
+async def _gather(*awaitables):
+    """Run independent awaitables concurrently; on the first failure cancel the rest and re-raise"""
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+# Output settings when the request has no output object: return full results without saving
+PREVIEW_OUTPUT = {"save_to_db": False, "return_results": True, "format": "full"}
+# Defaults for fields missing from a request's output object
+OUTPUT_DEFAULTS = {"save_to_db": True, "return_results": False, "format": "full"}
+
+
 class OutputHandler:
     """Handles flexible output formatting and storage"""
     
@@ -71,25 +127,10 @@ class OutputHandler:
         - Default save_to_db (with output) = True
         - Default entity_type = "restaurant"
         """
-        if "output" not in request_data:
-            # No output object = return full results without saving
-            request_data["output"] = {
-                "save_to_db": False,
-                "return_results": True,
-                "format": "full"
-            }
-        else:
-            # With output object, apply individual defaults
-            if "format" not in request_data["output"]:
-                request_data["output"]["format"] = "full"
-            if "return_results" not in request_data["output"]:
-                request_data["output"]["return_results"] = False
-            if "save_to_db" not in request_data["output"]:
-                request_data["output"]["save_to_db"] = True
-        
-        # Entity type default
-        if "entity_type" not in request_data:
-            request_data["entity_type"] = "restaurant"
+        output = request_data.get("output")
+        # One merge instead of per-field existence checks; the caller's output dict is not mutated
+        request_data["output"] = dict(PREVIEW_OUTPUT) if output is None else {**OUTPUT_DEFAULTS, **output}
+        request_data.setdefault("entity_type", "restaurant")
         
         return request_data
     
@@ -155,6 +196,36 @@ class OutputHandler:
 
         return saved_items
 
+    @staticmethod
+    def save_results_many(db, results_list: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Save entities and curations from many results in one round-trip per collection.
+
+        A single record is still two writes to two collections, so save_results
+        keeps using update_one/insert_one; batching pays off across records.
+        Uses synchronous PyMongo operations — do NOT await.
+
+        Args:
+            db: PyMongo synchronous Database
+            results_list: Results dictionaries, as passed to save_results
+
+        Returns:
+            Count of saved items per type
+        """
+        entity_ops = [
+            UpdateOne({"entity_id": results["entity"]["entity_id"]}, {"$set": results["entity"]}, upsert=True)
+            for results in results_list if "entity" in results
+        ]
+        curation_ops = [InsertOne(results["curation"]) for results in results_list if "curation" in results]
+
+        # Ordered so a later result for the same entity_id wins, as with sequential saves
+        if entity_ops:
+            db.entities.bulk_write(entity_ops, ordered=True)
+        if curation_ops:
+            db.curations.bulk_write(curation_ops, ordered=False)
+
+        return {"entity": len(entity_ops), "curation": len(curation_ops)}
+
 
 class AIOrchestrator:
     """Main orchestration service combining all AI operations"""
@@ -175,7 +246,7 @@ class AIOrchestrator:
         self.category_service = CategoryService(db)
         self.config_service = OpenAIConfigService(db)
     
-    async def detect_workflow(self, request: Dict[str, Any]) -> str:
+    def detect_workflow(self, request: Dict[str, Any]) -> str:
         """
         Auto-detect workflow type based on inputs.
         
@@ -187,35 +258,22 @@ class AIOrchestrator:
         - place_id_with_audio_and_image
         - etc.
         """
-        has_place_id = "place_id" in request
-        has_entity_id = "entity_id" in request
-        has_audio = "audio_file" in request or "audio_url" in request
-        has_image = "image_file" in request or "image_url" in request
-        has_text = "text" in request
-        
         # Manual workflow type takes precedence
         if request.get("workflow_type") != "auto":
             return request.get("workflow_type", "auto")
         
         # Auto-detect based on combinations
-        if has_place_id and has_audio and has_image:
-            return "place_id_with_audio_and_image"
-        elif has_place_id and has_audio:
-            return "place_id_with_audio"
-        elif has_place_id and has_image:
-            return "place_id_with_image"
-        elif has_entity_id and has_audio:
-            return "entity_id_with_audio"
-        elif has_entity_id and has_image:
-            return "entity_id_with_image"
-        elif has_audio or has_text:
-            return "audio_only"
-        elif has_image:
-            return "image_only"
-        elif has_place_id:
-            return "place_id_only"
-        else:
+        mask = (
+            ("place_id" in request and _PLACE_ID)
+            | ("entity_id" in request and _ENTITY_ID)
+            | (("audio_file" in request or "audio_url" in request) and _AUDIO)
+            | (("image_file" in request or "image_url" in request) and _IMAGE)
+            | ("text" in request and _TEXT)
+        )
+        workflow = _WORKFLOW_TABLE[mask]
+        if workflow is None:
             raise ValueError("Cannot detect workflow: insufficient inputs")
+        return workflow
     
     async def orchestrate(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -233,7 +291,7 @@ class AIOrchestrator:
         request = self.output_handler.apply_defaults(request)
         
         # Detect workflow
-        workflow = await self.detect_workflow(request)
+        workflow = self.detect_workflow(request)
         
         # Execute workflow
         results = await self.execute_workflow(workflow, request)
@@ -264,6 +322,8 @@ class AIOrchestrator:
         """Execute the detected workflow"""
         results = {}
         entity_type = request.get("entity_type", "restaurant")
+        # One timestamp for the entity and curation created by this run
+        now = datetime.now(timezone.utc)
         
         # Extract save_to_cache flag from output config
         save_to_cache = request.get("output", {}).get("save_to_db", False)
@@ -310,17 +370,17 @@ class AIOrchestrator:
             if not self.places:
                 raise ValueError("Places service not configured")
             
-            # 1. Fetch place details
-            place_data = await self.places.get_place_details(request["place_id"])
-            results["entity"] = self.transform_to_entity(place_data, entity_type)
-            
-            # 2. Transcribe audio
+            # 1-2. Fetch place details and transcribe audio (independent, run together)
             audio = request.get("audio_file") or request.get("audio_url")
-            transcription = await self.openai.transcribe_audio(
-                audio, 
-                request.get("language", "pt-BR"),
-                save_to_cache=save_to_cache
+            place_data, transcription = await _gather(
+                self.places.get_place_details(request["place_id"]),
+                self.openai.transcribe_audio(
+                    audio, 
+                    request.get("language", "pt-BR"),
+                    save_to_cache=save_to_cache
+                )
             )
+            results["entity"] = self.transform_to_entity(place_data, entity_type, now)
             results["transcription"] = transcription
             
             # 3. Extract concepts
@@ -335,7 +395,7 @@ class AIOrchestrator:
             # 4. Create curation
             categories = OutputHandler.extract_categories(concepts)
             results["curation"] = {
-                "curation_id": f"cur_{uuid.uuid4().hex[:12]}",
+                "curation_id": "cur_" + token_hex(6),
                 "entity_id": results["entity"]["entity_id"],
                 "curator_id": request.get("curator_id"),
                 "transcription_id": transcription.get("transcription_id"),
@@ -351,88 +411,85 @@ class AIOrchestrator:
                 "categories": categories,
                 "source": "text_analysis",
                 "entity_type": entity_type,
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now
             }
         
         elif workflow == "place_id_with_image":
             if not self.places:
                 raise ValueError("Places service not configured")
             
-            # 1. Fetch place details
-            place_data = await self.places.get_place_details(request["place_id"])
-            results["entity"] = self.transform_to_entity(place_data, entity_type)
-            
-            # 2. Analyze image
+            # 1-2. Fetch place details and analyze image (independent, run together)
             image = request.get("image_file") or request.get("image_url")
-            image_analysis = await self.openai.analyze_image(
-                image, 
-                entity_type,
-                save_to_cache=save_to_cache
+            place_data, image_analysis = await _gather(
+                self.places.get_place_details(request["place_id"]),
+                self.openai.analyze_image(
+                    image, 
+                    entity_type,
+                    save_to_cache=save_to_cache
+                )
             )
+            results["entity"] = self.transform_to_entity(place_data, entity_type, now)
             image_analysis["category_context"] = entity_type
             results["image_analysis"] = image_analysis
             
             # 3. Create curation
             categories = OutputHandler.extract_categories(image_analysis)
             results["curation"] = {
-                "curation_id": f"cur_{uuid.uuid4().hex[:12]}",
+                "curation_id": "cur_" + token_hex(6),
                 "entity_id": results["entity"]["entity_id"],
                 "curator_id": request.get("curator_id"),
                 "categories": categories,
                 "source": "image_analysis",
                 "visual_notes": image_analysis.get("visual_notes"),
                 "entity_type": entity_type,
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now
             }
         
         elif workflow == "place_id_with_audio_and_image":
             if not self.places:
                 raise ValueError("Places service not configured")
             
-            # Complete workflow: place + audio + image
-            place_data = await self.places.get_place_details(request["place_id"])
-            results["entity"] = self.transform_to_entity(place_data, entity_type)
-            
-            # Transcribe audio
+            # Complete workflow: place, audio and image lookups are independent, run together
             audio = request.get("audio_file") or request.get("audio_url")
-            transcription = await self.openai.transcribe_audio(
-                audio, 
-                request.get("language", "pt-BR"),
-                save_to_cache=save_to_cache
+            image = request.get("image_file") or request.get("image_url")
+            place_data, transcription, image_analysis = await _gather(
+                self.places.get_place_details(request["place_id"]),
+                self.openai.transcribe_audio(
+                    audio, 
+                    request.get("language", "pt-BR"),
+                    save_to_cache=save_to_cache
+                ),
+                self.openai.analyze_image(
+                    image, 
+                    entity_type,
+                    save_to_cache=save_to_cache
+                )
             )
+            results["entity"] = self.transform_to_entity(place_data, entity_type, now)
             results["transcription"] = transcription
             
-            # Extract concepts from text
+            # Extract concepts from text (needs the transcription)
             text_concepts = await self.openai.extract_concepts_from_text(
                 transcription["text"],
                 entity_type,
                 save_to_cache=save_to_cache
             )
             results["text_concepts"] = text_concepts
-            
-            # Analyze image
-            image = request.get("image_file") or request.get("image_url")
-            image_analysis = await self.openai.analyze_image(
-                image, 
-                entity_type,
-                save_to_cache=save_to_cache
-            )
             results["image_analysis"] = image_analysis
             
             # Combine categories from both sources (merge and deduplicate per category)
             text_categories = OutputHandler.extract_categories(text_concepts)
             image_categories = OutputHandler.extract_categories(image_analysis)
             
-            combined_categories = {}
-            all_category_keys = set(text_categories.keys()) | set(image_categories.keys())
-            for key in all_category_keys:
-                text_vals = text_categories.get(key, [])
-                image_vals = image_categories.get(key, [])
-                combined_categories[key] = list(set(text_vals + image_vals))  # Deduplicate per category
+            # dict.fromkeys dedupes in one pass and keeps first-seen order (text, then image)
+            combined_categories = {
+                key: list(dict.fromkeys(chain(text_categories.get(key, []), image_categories.get(key, []))))
+                for key in dict.fromkeys(chain(text_categories, image_categories))
+            }
             
             # Create curation with combined categories
             results["curation"] = {
-                "curation_id": f"cur_{uuid.uuid4().hex[:12]}",
+                "curation_id": "cur_" + token_hex(6),
                 "entity_id": results["entity"]["entity_id"],
                 "curator_id": request.get("curator_id"),
                 "transcription_id": transcription.get("transcription_id"),
@@ -452,7 +509,7 @@ class AIOrchestrator:
                 },
                 "visual_notes": image_analysis.get("visual_notes"),
                 "entity_type": entity_type,
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now
             }
         
         else:
@@ -460,25 +517,32 @@ class AIOrchestrator:
         
         return results
     
-    def transform_to_entity(self, place_data: Dict[str, Any], entity_type: str) -> Dict[str, Any]:
+    def transform_to_entity(
+        self,
+        place_data: Dict[str, Any],
+        entity_type: str,
+        created_at: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Transform Google Place data to entity format.
         
         Args:
             place_data: Place data from Google Places API
             entity_type: Type of entity
+            created_at: Creation timestamp (defaults to now)
             
         Returns:
             Entity dictionary
         """
         # Simplified transformation (you may want to enhance this)
+        place_id = place_data.get("place_id")
         return {
-            "entity_id": f"place_{place_data.get('place_id')}",
+            "entity_id": f"place_{place_id}",
             "name": place_data.get("name"),
             "entity_type": entity_type,
             "location": place_data.get("geometry", {}).get("location"),
             "address": place_data.get("formatted_address"),
-            "place_id": place_data.get("place_id"),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "place_id": place_id,
+            "created_at": created_at or datetime.now(timezone.utc),
             "source": "google_places"
         }
@@ -5,7 +5,8 @@ Provides access to concept categories by entity type with caching and fallback l
 """
 
 import time
-from typing import List, Optional, Dict
+from collections import OrderedDict
+from typing import List, Optional, Dict, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime, timezone
 
@@ -13,18 +14,21 @@ from datetime import datetime, timezone
 class CategoryService:
     """Manages concept categories from MongoDB with in-memory caching"""
     
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncIOMotorDatabase, max_entries: int = 64):
         """
         Initialize CategoryService.
         
         Args:
             db: Motor async MongoDB database instance
+            max_entries: Maximum cached entity types; least recently used are evicted first
         """
         self.db = db
-        self.cache: Dict[str, tuple] = {}
+        # cache_key -> (categories tuple, time.monotonic() when stored)
+        self.cache: "OrderedDict[str, Tuple[Tuple[str, ...], float]]" = OrderedDict()
         self.cache_ttl = 3600  # 1 hour cache TTL
+        self.max_entries = max_entries
     
-    async def get_categories(self, entity_type: str = "restaurant") -> List[str]:
+    async def get_categories(self, entity_type: str = "restaurant") -> Tuple[str, ...]:
         """
         Get categories for entity type with caching.
         
@@ -32,20 +36,23 @@ class CategoryService:
             entity_type: Type of entity (restaurant, bar, hotel, attraction)
             
         Returns:
-            List of concept category strings
+            Tuple of concept category strings (shared with the cache, immutable)
             
         Notes:
-            - Uses in-memory cache (1h TTL)
+            - Uses in-memory LRU cache (1h TTL, max_entries entity types)
             - Falls back to restaurant categories if entity_type not found
-            - Returns empty list if no categories found at all
+            - Returns empty tuple if no categories found at all
         """
         cache_key = f"categories:{entity_type}"
         
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
-                return cached_data
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            categories, timestamp = cached
+            if time.monotonic() - timestamp < self.cache_ttl:
+                self.cache.move_to_end(cache_key)
+                return categories
+            del self.cache[cache_key]
         
         # Fetch from MongoDB
         doc = await self.db.categories.find_one({
@@ -53,18 +60,23 @@ class CategoryService:
             "active": True
         })
         
-        if not doc:
-            # Fallback to restaurant categories
-            if entity_type != "restaurant":
-                return await self.get_categories("restaurant")
-            else:
-                # No categories at all
-                return []
-        
-        categories = doc.get("categories", [])
-        
-        # Update cache
-        self.cache[cache_key] = (categories, time.time())
+        if doc:
+            categories = tuple(doc.get("categories", []))
+        elif entity_type != "restaurant":
+            # Fallback to restaurant categories, cached under this key too so
+            # the next lookup for this type does not miss twice
+            categories = await self.get_categories("restaurant")
+            if not categories:
+                return ()
+        else:
+            # No categories at all
+            return ()
+        
+        # Update cache (tuples, so the cached value can be handed out without copying)
+        self.cache[cache_key] = (categories, time.monotonic())
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
         
         return categories
     
@@ -90,7 +102,7 @@ class CategoryService:
             {
                 "$set": {
                     "categories": categories,
-                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                    "updated_at": datetime.now(timezone.utc),
                     "updated_by": updated_by
                 },
                 "$inc": {"version": 1}
@@ -99,9 +111,7 @@ class CategoryService:
         )
         
         # Invalidate cache
-        cache_key = f"categories:{entity_type}"
-        if cache_key in self.cache:
-            del self.cache[cache_key]
+        self.cache.pop(f"categories:{entity_type}", None)
         
         return {
             "updated": True, 
@@ -116,7 +126,8 @@ class CategoryService:
         Returns:
             List of entity type strings
         """
-        cursor = self.db.categories.find({"active": True})
+        # Project only entity_type so the category arrays never leave the server
+        cursor = self.db.categories.find({"active": True}, {"entity_type": 1, "_id": 0})
         entity_types = []
         
         async for doc in cursor:
@@ -131,14 +142,22 @@ class CategoryService:
         Returns:
             Dictionary mapping entity_type to category count
         """
-        cursor = self.db.categories.find({"active": True})
+        # Count categories server-side with $size instead of shipping the arrays
+        pipeline = [
+            {"$match": {"active": True}},
+            {"$project": {
+                "_id": 0,
+                "entity_type": 1,
+                "count": {"$size": {"$ifNull": ["$categories", []]}}
+            }}
+        ]
         stats = {}
         
-        async for doc in cursor:
-            stats[doc["entity_type"]] = len(doc.get("categories", []))
+        async for doc in self.db.categories.aggregate(pipeline):
+            stats[doc["entity_type"]] = doc["count"]
         
         return stats
     
     def clear_cache(self):
         """Clear the entire cache (useful for testing)"""
-        self.cache = {}
+        self.cache.clear()
@@ -0,0 +1,47 @@
+"""
+Shared HTTP client for outbound API calls (Google Places).
+
+A single pooled httpx.AsyncClient is reused across requests so connections
+stay alive between calls instead of paying a TCP+TLS handshake each time.
+Created lazily on first use and closed at application shutdown.
+"""
+
+from typing import Optional
+import httpx
+import logging
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Global client
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use"""
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+        )
+        logger.info(f"HTTP client created (http2={HTTP2_AVAILABLE})")
+
+    return _client
+
+
+async def close_http_client():
+    """Close the shared AsyncClient - called at shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("✅ HTTP client closed")
@@ -9,7 +9,7 @@ and curations to provide a unified, LLM-friendly view of restaurant information.
 """
 
 from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime, time
+from datetime import datetime, time, timezone
 import pytz
 import logging
 import threading
@@ -38,6 +38,9 @@ PLACES_API_TEXT_SEARCH_URL = "https://places.googleapis.com/v1/places:searchText
 PLACES_API_DETAILS_URL = "https://places.googleapis.com/v1/places"
 PLACES_API_PHOTO_MEDIA_URL = "https://places.googleapis.com/v1/{photo_name}/media"
 
+# Google Places day index -> day name (0 = Sunday)
+GOOGLE_DAY_NAMES = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+
 
 class LLMPlaceService:
     """
@@ -173,8 +176,26 @@ class LLMPlaceService:
         Returns:
             Photo URL
         """
-        url = PLACES_API_PHOTO_MEDIA_URL.format(photo_name=photo_name)
+        query = self.build_photo_query(max_width, max_height, skip_redirect)
+        return PLACES_API_PHOTO_MEDIA_URL.format(photo_name=photo_name) + query
+    
+    def build_photo_query(
+        self,
+        max_width: Optional[int] = None,
+        max_height: Optional[int] = None,
+        skip_redirect: bool = False
+    ) -> str:
+        """
+        Build the Photo Media query string shared by every photo of a request.
         
+        Args:
+            max_width: Maximum width in pixels (400-4800)
+            max_height: Maximum height in pixels (400-4800)
+            skip_redirect: If True, returns direct image bytes URL
+            
+        Returns:
+            Query string including the leading "?"
+        """
         params = []
         if max_width:
             params.append(f"maxWidthPx={max_width}")
@@ -185,10 +206,7 @@ class LLMPlaceService:
         
         params.append(f"key={settings.google_places_api_key}")
         
-        if params:
-            url += "?" + "&".join(params)
-        
-        return url
+        return "?" + "&".join(params)
     
     def search_google_places(
         self,
@@ -305,7 +323,7 @@ class LLMPlaceService:
                 coordinates = [location["longitude"], location["latitude"]]
             
             # Build entity document
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             entity_doc = {
                 "name": name,
                 "externalId": place_id,
@@ -433,8 +451,9 @@ class LLMPlaceService:
                 update_fields["data.priceLevel"] = google_data["priceLevel"]
             
             # Always update timestamp
-            update_fields["data.google_last_updated"] = datetime.utcnow().isoformat()
-            update_fields["updatedAt"] = datetime.utcnow()
+            now = datetime.now(timezone.utc)
+            update_fields["data.google_last_updated"] = now.isoformat()
+            update_fields["updatedAt"] = now
             
             # Perform update only if there are fields to update
             if update_fields:
@@ -882,24 +901,19 @@ class LLMPlaceService:
                 "total": 0
             }
         
-        # Build photo objects with URLs
+        # Build photo objects with URLs. Photo URLs are resolved client-side
+        # (Google redirects to the image), so no per-photo request is made here;
+        # the query string is identical for every photo and built once.
+        photo_query = self.build_photo_query(max_width, max_height, skip_redirect=False)
         photos = []
         for idx, photo_meta in enumerate(photos_metadata):
             photo_name = photo_meta.get("name")
             if not photo_name:
                 continue
             
-            # Build photo URL
-            url = self.build_photo_url(
-                photo_name=photo_name,
-                max_width=max_width,
-                max_height=max_height,
-                skip_redirect=False
-            )
-            
             photo_obj = {
                 "index": idx,
-                "url": url,
+                "url": PLACES_API_PHOTO_MEDIA_URL.format(photo_name=photo_name) + photo_query,
                 "photo_reference": photo_name
             }
             
@@ -969,7 +983,94 @@ class LLMPlaceService:
             timezone=timezone
         )
         
-        # Build availability response
+        return self.build_availability(snapshot, timezone=timezone, weekend_days=weekend_days)
+    
+    def get_restaurant_bundle(
+        self,
+        query: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        radius_m: int = 5000,
+        max_results: int = 5,
+        language: str = "pt-BR",
+        region: str = "BR",
+        include_snapshot: bool = True,
+        include_availability: bool = True,
+        timezone: str = "America/Sao_Paulo",
+        weekend_days: List[str] = ["saturday", "sunday"]
+    ) -> Dict[str, Any]:
+        """
+        Search, snapshot and availability for the best match in one call.
+        
+        The top search result is resolved once and both the snapshot and the
+        availability block are derived from that single snapshot, instead of
+        the client chaining three requests (availability would otherwise
+        rebuild the snapshot a second time).
+        
+        Args:
+            query: Restaurant name or search query
+            latitude: Optional latitude for location bias
+            longitude: Optional longitude for location bias
+            radius_m: Search radius in meters
+            max_results: Maximum search results to return
+            language: Language code
+            region: Region code
+            include_snapshot: Whether to return the top result's snapshot
+            include_availability: Whether to return the top result's availability
+            timezone: Timezone for time calculations
+            weekend_days: Days considered as weekend
+            
+        Returns:
+            Dictionary with items, snapshot, availability and sources_used
+        """
+        items = self.search_restaurants(
+            query=query,
+            latitude=latitude,
+            longitude=longitude,
+            radius_m=radius_m,
+            max_results=max_results,
+            language=language,
+            region=region
+        )
+        
+        snapshot = None
+        availability = None
+        sources_used = []
+        
+        if items and (include_snapshot or include_availability):
+            top = items[0]
+            snapshot, sources_used = self.get_restaurant_snapshot(
+                place_id=top.place_id,
+                entity_id=top.entity_id,
+                timezone=timezone
+            )
+            if include_availability:
+                availability = self.build_availability(snapshot, timezone=timezone, weekend_days=weekend_days)
+        
+        return {
+            "items": items,
+            "snapshot": snapshot if include_snapshot else None,
+            "availability": availability,
+            "sources_used": sources_used
+        }
+    
+    def build_availability(
+        self,
+        snapshot: LLMRestaurantSnapshot,
+        timezone: str = "America/Sao_Paulo",
+        weekend_days: List[str] = ["saturday", "sunday"]
+    ) -> Dict[str, Any]:
+        """
+        Build availability information from a restaurant snapshot.
+        
+        Args:
+            snapshot: Snapshot with opening hours and status
+            timezone: Timezone used for the snapshot
+            weekend_days: Days considered as weekend
+            
+        Returns:
+            Dictionary with availability information
+        """
         availability_by_day = {}
         weekend_days_open = []
         open_on_weekend = False
@@ -1044,9 +1145,8 @@ class LLMPlaceService:
             if not regular_hours_data:
                 return None, None
             
-            # Parse regular hours
-            regular_hours = {}
-            day_names = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
+            # Parse regular hours (every day present, in Sunday..Saturday order)
+            regular_hours = {day: [] for day in GOOGLE_DAY_NAMES}
             
             periods = regular_hours_data.get("periods", [])
             for period in periods:
@@ -1057,12 +1157,9 @@ class LLMPlaceService:
                 if day_index is None:
                     continue
                 
-                day_name = day_names[day_index] if 0 <= day_index < 7 else None
-                if not day_name:
+                if not 0 <= day_index < 7:
                     continue
-                
-                if day_name not in regular_hours:
-                    regular_hours[day_name] = []
+                day_name = GOOGLE_DAY_NAMES[day_index]
                 
                 # Format time
                 open_hour = open_info.get("hour", 0)
@@ -1077,11 +1174,6 @@ class LLMPlaceService:
                 
                 regular_hours[day_name].append(period_obj)
             
-            # Ensure all days are present
-            for day in day_names:
-                if day not in regular_hours:
-                    regular_hours[day] = []
-            
             opening_hours = LLMRestaurantOpeningHours(
                 source="google_places",
                 timezone=timezone_str,
@@ -1104,7 +1196,7 @@ class LLMPlaceService:
             # Check weekend availability
             weekend_check = ["saturday", "sunday"]
             for day in weekend_check:
-                if day in regular_hours and len(regular_hours[day]) > 0:
+                if regular_hours[day]:
                     open_on_weekend = True
                     weekend_days_open.append(day)
             
@@ -1223,9 +1315,10 @@ class LLMPlaceService:
                         strength=data.get("strength")
                     ))
             
+            # dict.fromkeys dedupes while keeping first-seen order (set() order varies per process)
             curation_block = LLMRestaurantCuration(
-                tags=list(set(all_tags)) if all_tags else None,
-                highlights=list(set(all_highlights)) if all_highlights else None,
+                tags=list(dict.fromkeys(all_tags)) if all_tags else None,
+                highlights=list(dict.fromkeys(all_highlights)) if all_highlights else None,
                 sources=sources if sources else None
             )
         
@@ -85,8 +85,8 @@ class OpenAIConfigService:
         for key, value in variables.items():
             placeholder = "{" + key + "}"
             
-            # Convert lists to comma-separated strings
-            if isinstance(value, list):
+            # Convert lists/tuples to comma-separated strings
+            if isinstance(value, (list, tuple)):
                 value = ", ".join(str(v) for v in value)
             
             prompt_template = prompt_template.replace(placeholder, str(value))
@@ -111,7 +111,7 @@ class OpenAIConfigService:
             Dictionary with update status
         """
         # Add metadata
-        updates["updated_at"] = datetime.now(timezone.utc).isoformat()
+        updates["updated_at"] = datetime.now(timezone.utc)
         updates["updated_by"] = updated_by
         
         result = self.db.openai_configs.update_one(
@@ -149,7 +149,7 @@ class OpenAIConfigService:
             {
                 "$set": {
                     "enabled": enabled,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
+                    "updated_at": datetime.now(timezone.utc)
                 }
             }
         )
@@ -5,10 +5,11 @@ Provides transcription (Whisper), concept extraction (GPT-4), and image analysis
 using configurations and prompts stored in MongoDB.
 """
 
+import asyncio
 import base64
 import hashlib
 import io
-import json
+import orjson
 import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
@@ -22,6 +23,25 @@ from app.services.category_service import CategoryService
 from app.services.openai_config_service import OpenAIConfigService
 
 
+def normalize_language_code(language: str) -> Optional[str]:
+    """
+    Normalize a locale to the ISO-639-1 code Whisper expects (pt-BR -> pt).
+    
+    Uses plain string checks instead of a regex; this runs on every
+    transcription request.
+    
+    Args:
+        language: Language or locale code
+        
+    Returns:
+        Two-letter lowercase code, or None if the input is not a valid code
+    """
+    code = language.partition('-')[0].lower()
+    if len(code) == 2 and code.isascii() and code.isalpha():
+        return code
+    return None
+
+
 class OpenAIService:
     """OpenAI service using MongoDB configuration"""
     
@@ -72,8 +92,12 @@ class OpenAIService:
         params = config["config"].copy()
         if language:
             # Normalize language to ISO-639-1 format (pt-BR → pt)
-            normalized_lang = language.split('-')[0].lower()
-            params["language"] = normalized_lang
+            normalized_lang = normalize_language_code(language)
+            if normalized_lang:
+                params["language"] = normalized_lang
+            else:
+                # Whisper rejects non ISO-639-1 codes; let it auto-detect instead
+                print(f"[WARNING] Ignoring invalid transcription language: {language!r}")
         
         # Handle base64 audio data conversion
         try:
@@ -93,7 +117,8 @@ class OpenAIService:
             
             # Call OpenAI
             print(f"[DEBUG] Calling OpenAI Whisper API with model: {model}")
-            response = self.client.audio.transcriptions.create(
+            response = await asyncio.to_thread(
+                self.client.audio.transcriptions.create,
                 model=model,
                 file=audio_file,
                 **params
@@ -159,14 +184,15 @@ class OpenAIService:
         )
         
         # Call OpenAI
-        response = self.client.chat.completions.create(
+        response = await asyncio.to_thread(
+            self.client.chat.completions.create,
             model=config["model"],
             messages=[{"role": "user", "content": prompt}],
             **config["config"]
         )
         
         # Parse JSON response
-        raw_result = json.loads(response.choices[0].message.content)
+        raw_result = orjson.loads(response.choices[0].message.content)
 
         # Normalize to the frontend-compatible shape expected by ConceptModule:
         # {
@@ -183,7 +209,8 @@ class OpenAIService:
             values = raw_result.get(category_key)
             if not isinstance(values, list):
                 continue
-            cleaned_values = [str(v).strip() for v in values if str(v).strip()]
+            # dict.fromkeys drops repeats the model emits while keeping their order
+            cleaned_values = list(dict.fromkeys(str(v).strip() for v in values if str(v).strip()))
             if cleaned_values:
                 normalized_categories[category_key] = cleaned_values
 
@@ -199,6 +226,9 @@ class OpenAIService:
                     if allowed_category_keys and category_key not in allowed_category_keys:
                         continue
                     normalized_categories.setdefault(category_key, []).append(str(value).strip())
+                normalized_categories = {
+                    key: list(dict.fromkeys(values)) for key, values in normalized_categories.items()
+                }
 
         normalized_concepts = [
             {"category": category_key, "value": value}
@@ -255,7 +285,8 @@ class OpenAIService:
             {"text": text}
         )
 
-        response = self.client.chat.completions.create(
+        response = await asyncio.to_thread(
+            self.client.chat.completions.create,
             model=config["model"],
             messages=[{"role": "user", "content": prompt}],
             **config["config"]
@@ -267,7 +298,7 @@ class OpenAIService:
         confidence_score = None
 
         try:
-            parsed = json.loads(raw_content)
+            parsed = orjson.loads(raw_content)
             if isinstance(parsed, dict):
                 restaurant_name = (
                     parsed.get("restaurant_name")
@@ -335,7 +366,8 @@ class OpenAIService:
         )
         
         # Call OpenAI Vision
-        response = self.client.chat.completions.create(
+        response = await asyncio.to_thread(
+            self.client.chat.completions.create,
             model=config["model"],
             messages=[
                 {
@@ -357,7 +389,7 @@ class OpenAIService:
         )
         
         # Parse JSON response
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         result["entity_type"] = entity_type
         result["model"] = config["model"]
         
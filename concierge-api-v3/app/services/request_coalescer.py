@@ -0,0 +1,58 @@
+"""
+RequestCoalescer: Collapses concurrent identical outbound calls into one.
+
+Callers that share a request fingerprint await the same in-flight task instead
+of each issuing its own HTTP call (e.g. identical Google Places lookups).
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+
+def request_fingerprint(operation: str, params: Dict[str, Any]) -> str:
+    """
+    Build a stable key for an outbound request.
+
+    Args:
+        operation: Operation name (e.g. "details", "text_search")
+        params: Request parameters; key order does not matter
+
+    Returns:
+        Hex digest identifying the (operation, params) pair
+    """
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(f"{operation}|{canonical}".encode(), digest_size=16).hexdigest()
+
+
+class RequestCoalescer:
+    """Shares one in-flight task between concurrent callers with the same key"""
+
+    def __init__(self):
+        """Initialize RequestCoalescer with an empty in-flight table."""
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    async def get_or_create(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await the in-flight call for key, starting it if none is running.
+
+        Args:
+            key: Request fingerprint (see request_fingerprint)
+            coro_factory: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            Result of the shared call (exceptions propagate to every caller)
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(coro_factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def in_flight_count(self) -> int:
+        """Number of calls currently running (useful for testing)"""
+        return len(self._in_flight)
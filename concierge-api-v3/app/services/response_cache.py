@@ -0,0 +1,77 @@
+"""
+ResponseCache: In-memory TTL cache for serialized API responses.
+
+Used to serve repeat Google Places lookups without another round-trip,
+following the same (data, timestamp) caching approach as CategoryService.
+"""
+
+import time
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """Caches serialized response payloads with a TTL and a size bound"""
+
+    def __init__(self, ttl: int = 3600, max_entries: int = 1000):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            ttl: Seconds a cached payload stays valid (0 disables caching)
+            max_entries: Maximum cached payloads; oldest entries are evicted first
+        """
+        self.cache: Dict[str, tuple] = {}
+        self.cache_ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached payload.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Serialized payload, or None on miss/expiry
+        """
+        if key in self.cache:
+            cached_data, timestamp = self.cache[key]
+            if time.time() - timestamp < self.cache_ttl:
+                self.hits += 1
+                return cached_data
+            del self.cache[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, payload: str):
+        """
+        Store a serialized payload.
+
+        Args:
+            key: Cache key
+            payload: Serialized response (e.g. model_dump_json output)
+        """
+        if self.cache_ttl <= 0:
+            return
+
+        self.cache.pop(key, None)
+        while len(self.cache) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self.cache[next(iter(self.cache))]
+
+        self.cache[key] = (payload, time.time())
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.cache)
+        }
+
+    def clear_cache(self):
+        """Clear the entire cache (useful for testing)"""
+        self.cache = {}
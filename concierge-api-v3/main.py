@@ -4,6 +4,7 @@ Main application entry point with PyMongo (sync) support
 """
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -35,7 +36,8 @@ app = FastAPI(
     docs_url="/api/v3/docs",  # Swagger UI
     redoc_url="/api/v3/redoc",  # ReDoc
     openapi_url="/api/v3/openapi.json",  # OpenAPI schema
-    redirect_slashes=False  # CRITICAL: Disable automatic trailing slash redirects for OAuth
+    redirect_slashes=False,  # CRITICAL: Disable automatic trailing slash redirects for OAuth
+    default_response_class=ORJSONResponse  # orjson encodes large Places/entity lists much faster than stdlib json
 )
 
 # Attach rate limiter to app state and register its exception handler
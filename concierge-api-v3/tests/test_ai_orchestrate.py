@@ -242,6 +242,27 @@ class TestAsyncAwaitPatterns:
 class TestOutputHandler:
     """Tests for OutputHandler methods"""
 
+    @pytest.mark.parametrize("request_data, expected_output", [
+        ({}, {"save_to_db": False, "return_results": True, "format": "full"}),
+        ({"output": {}}, {"save_to_db": True, "return_results": False, "format": "full"}),
+        ({"output": {"format": "ids_only"}}, {"save_to_db": True, "return_results": False, "format": "ids_only"}),
+        ({"output": {"save_to_db": False, "return_results": True}},
+         {"save_to_db": False, "return_results": True, "format": "full"}),
+    ])
+    def test_apply_defaults(self, request_data, expected_output):
+        """Missing output means preview; a partial output object gets per-field defaults"""
+        result = OutputHandler.apply_defaults(request_data)
+
+        assert result["output"] == expected_output
+        assert result["entity_type"] == "restaurant"
+
+    def test_apply_defaults_does_not_share_state(self):
+        """Defaults are copied, so one request cannot leak settings into the next"""
+        first = OutputHandler.apply_defaults({})
+        first["output"]["save_to_db"] = True
+
+        assert OutputHandler.apply_defaults({})["output"]["save_to_db"] is False
+
     def test_save_results_writes_to_mongo(self):
         """save_results deve usar operações síncronas do PyMongo (sem await)."""
         mock_db = MagicMock()
@@ -260,6 +281,181 @@ class TestOutputHandler:
         mock_db.entities.update_one.assert_called_once()
         mock_db.curations.insert_one.assert_called_once()
 
+    def test_save_results_many_batches_per_collection(self):
+        """Many results become one bulk_write per collection"""
+        mock_db = MagicMock()
+        results_list = [
+            {"entity": {"entity_id": "ent_001"}, "curation": {"curation_id": "cur_001"}},
+            {"entity": {"entity_id": "ent_002"}},
+            {"curation": {"curation_id": "cur_003"}},
+        ]
+
+        saved = OutputHandler.save_results_many(mock_db, results_list)
+
+        assert saved == {"entity": 2, "curation": 2}
+        entity_ops = mock_db.entities.bulk_write.call_args.args[0]
+        curation_ops = mock_db.curations.bulk_write.call_args.args[0]
+        assert [op._filter for op in entity_ops] == [{"entity_id": "ent_001"}, {"entity_id": "ent_002"}]
+        assert [op._doc["curation_id"] for op in curation_ops] == ["cur_001", "cur_003"]
+        mock_db.entities.update_one.assert_not_called()
+        mock_db.curations.insert_one.assert_not_called()
+
+
+class TestOrchestrateSerialization:
+    """Tests for the pre-serialized /ai/orchestrate response"""
+
+    @pytest.mark.asyncio
+    async def test_result_with_datetime_and_object_id_is_encoded(self):
+        """Raw datetimes and the ObjectId added by insert_one serialize to strings"""
+        from datetime import datetime, timezone
+        from bson import ObjectId
+        from app.api.ai import OrchestrateRequest, orchestrate
+
+        created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        object_id = ObjectId()
+
+        class FakeOrchestrator:
+            async def orchestrate(self, request):
+                return {
+                    "workflow": "audio_only",
+                    "results": {"curation": {"_id": object_id, "created_at": created_at}},
+                    "saved_to_db": True,
+                    "processing_time_ms": 5,
+                }
+
+        response = await orchestrate(OrchestrateRequest(text="hi"), orchestrator=FakeOrchestrator(), auth={})
+        body = json.loads(response.body)
+
+        assert response.media_type == "application/json"
+        assert body["results"]["curation"] == {"_id": str(object_id), "created_at": "2025-01-02T03:04:05+00:00"}
+
+
+class TestWorkflows:
+    """Tests for workflow execution with stubbed AI and Places services"""
+
+    @pytest.mark.asyncio
+    async def test_audio_and_image_categories_merge_in_order(self):
+        """Combined categories are deduplicated keeping text-then-image order"""
+        from app.services.ai_orchestrator import AIOrchestrator
+
+        class FakePlaces:
+            async def get_place_details(self, place_id):
+                return {"place_id": place_id, "name": "Dom Manolo"}
+
+        class FakeOpenAI:
+            async def transcribe_audio(self, audio, language, save_to_cache=False):
+                return {"text": "ótima pizza", "transcription_id": "t1"}
+
+            async def extract_concepts_from_text(self, text, entity_type, save_to_cache=False):
+                return {"categories": {"cuisine": ["pizza", "pasta"], "mood": ["cozy"]}}
+
+            async def analyze_image(self, image, entity_type, save_to_cache=False):
+                return {"categories": {"cuisine": ["salad", "pizza"], "setting": ["garden"]}}
+
+        orchestrator = AIOrchestrator(MagicMock(), FakeOpenAI(), places_service=FakePlaces())
+        results = await orchestrator.execute_workflow(
+            "place_id_with_audio_and_image",
+            {"place_id": "p1", "audio_file": "a", "image_file": "i"}
+        )
+
+        assert results["curation"]["categories"] == {
+            "cuisine": ["pizza", "pasta", "salad"],
+            "mood": ["cozy"],
+            "setting": ["garden"],
+        }
+        assert list(results["curation"]["categories"]) == ["cuisine", "mood", "setting"]
+        assert results["curation"]["created_at"] is results["entity"]["created_at"]
+        assert results["curation"]["curation_id"].startswith("cur_")
+        assert len(results["curation"]["curation_id"]) == len("cur_") + 12
+
+    @pytest.mark.asyncio
+    async def test_independent_lookups_run_concurrently(self):
+        """Place details, transcription and image analysis overlap; concepts wait for the transcript"""
+        import asyncio
+        from app.services.ai_orchestrator import AIOrchestrator
+
+        events = []
+
+        async def step(name, value):
+            events.append(f"start:{name}")
+            await asyncio.sleep(0.01)
+            events.append(f"end:{name}")
+            return value
+
+        class FakePlaces:
+            def get_place_details(self, place_id):
+                return step("place", {"place_id": place_id})
+
+        class FakeOpenAI:
+            def transcribe_audio(self, audio, language, save_to_cache=False):
+                return step("audio", {"text": "ótima pizza"})
+
+            def extract_concepts_from_text(self, text, entity_type, save_to_cache=False):
+                return step("concepts", {"categories": {}})
+
+            def analyze_image(self, image, entity_type, save_to_cache=False):
+                return step("image", {"categories": {}})
+
+        orchestrator = AIOrchestrator(MagicMock(), FakeOpenAI(), places_service=FakePlaces())
+        await orchestrator.execute_workflow(
+            "place_id_with_audio_and_image",
+            {"place_id": "p1", "audio_file": "a", "image_file": "i"}
+        )
+
+        assert events[:3] == ["start:place", "start:audio", "start:image"]
+        assert events.index("start:concepts") > events.index("end:audio")
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_cancels_the_others(self):
+        """The first failure is raised and sibling lookups are cancelled"""
+        import asyncio
+        from app.services.ai_orchestrator import AIOrchestrator
+
+        cancelled = []
+
+        class FakePlaces:
+            async def get_place_details(self, place_id):
+                raise RuntimeError("places down")
+
+        class FakeOpenAI:
+            async def analyze_image(self, image, entity_type, save_to_cache=False):
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append("image")
+                    raise
+
+        orchestrator = AIOrchestrator(MagicMock(), FakeOpenAI(), places_service=FakePlaces())
+        with pytest.raises(RuntimeError, match="places down"):
+            await orchestrator.execute_workflow("place_id_with_image", {"place_id": "p1", "image_url": "i"})
+        await asyncio.sleep(0)
+
+        assert cancelled == ["image"]
+
+    @pytest.mark.parametrize("request_data, expected", [
+        ({"place_id": "p", "audio_file": "a", "image_url": "i"}, "place_id_with_audio_and_image"),
+        ({"place_id": "p", "entity_id": "e", "audio_url": "a"}, "place_id_with_audio"),
+        ({"entity_id": "e", "image_file": "i"}, "entity_id_with_image"),
+        ({"entity_id": "e", "text": "t"}, "audio_only"),
+        ({"image_url": "i"}, "image_only"),
+        ({"place_id": "p"}, "place_id_only"),
+    ])
+    def test_detect_workflow_precedence(self, request_data, expected):
+        """Auto-detection resolves input combinations in the documented order"""
+        from app.services.ai_orchestrator import AIOrchestrator
+
+        orchestrator = AIOrchestrator(MagicMock(), MagicMock())
+        assert orchestrator.detect_workflow({"workflow_type": "auto", **request_data}) == expected
+
+    def test_detect_workflow_manual_and_insufficient(self):
+        """Manual workflow_type wins; no usable inputs raises ValueError"""
+        from app.services.ai_orchestrator import AIOrchestrator
+
+        orchestrator = AIOrchestrator(MagicMock(), MagicMock())
+        assert orchestrator.detect_workflow({"workflow_type": "image_only", "place_id": "p"}) == "image_only"
+        with pytest.raises(ValueError):
+            orchestrator.detect_workflow({"workflow_type": "auto", "entity_id": "e"})
+
 
 # Fixtures removed - using global fixtures from conftest.py
 # - async_client: defined in conftest.py with pytest_asyncio
@@ -158,3 +158,27 @@ def test_oauth_init_accepts_trusted_callback_url():
     decoded = jwt.decode(state_encoded, settings.api_secret_key, algorithms=["HS256"])
     sd = decoded.get("sd", "")
     assert trusted in sd, f"State deveria conter a URL confiável: {sd}"
+
+
+def test_get_user_by_email_builds_user_from_stored_document():
+    """Stored users are loaded without re-validation, with the ObjectId as str"""
+    from unittest.mock import MagicMock
+    from bson import ObjectId
+    from app.api.auth import get_user_by_email
+
+    object_id = ObjectId()
+    db = MagicMock()
+    db.users.find_one.return_value = {
+        "_id": object_id,
+        "email": "curator@example.com",
+        "google_id": "g-1",
+        "name": "Curator",
+        "authorized": True,
+    }
+
+    user = get_user_by_email(db, "curator@example.com")
+
+    assert user.id == str(object_id)
+    assert user.authorized is True
+    assert user.role == "curator"
+    assert user.model_dump(by_alias=True)["_id"] == str(object_id)
@@ -53,3 +53,74 @@ class TestConceptsValidation:
             data = response.json()
             # Should have entity_type or be a dict
             assert isinstance(data, dict)
+
+
+class FakeCategoriesCollection:
+    """Async find_one over canned category docs, counting lookups"""
+    
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = 0
+    
+    async def find_one(self, query):
+        self.calls += 1
+        return self.docs.get(query["entity_type"])
+    
+    async def aggregate(self, pipeline):
+        self.pipeline = pipeline
+        for entity_type, doc in self.docs.items():
+            yield {"entity_type": entity_type, "count": len(doc.get("categories", []))}
+
+
+class TestCategoryServiceCache:
+    """Test CategoryService caching without MongoDB"""
+    
+    @staticmethod
+    def _service(docs, **kwargs):
+        from types import SimpleNamespace
+        from app.services.category_service import CategoryService
+        
+        return CategoryService(SimpleNamespace(categories=FakeCategoriesCollection(docs)), **kwargs)
+    
+    @pytest.mark.asyncio
+    async def test_cached_categories_are_shared_immutable_tuples(self):
+        """Cache hits hand out the cached tuple itself, without copying"""
+        service = self._service({"restaurant": {"categories": ["cuisine", "mood"]}})
+        
+        first = await service.get_categories("restaurant")
+        
+        assert first == ("cuisine", "mood")
+        assert await service.get_categories("restaurant") is first
+        assert service.db.categories.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_fallback_is_cached_under_requested_type(self):
+        """Unknown types fall back to restaurant once, then hit the cache"""
+        service = self._service({"restaurant": {"categories": ["cuisine"]}})
+        
+        assert await service.get_categories("bar") == ("cuisine",)
+        assert await service.get_categories("bar") == ("cuisine",)
+        assert service.db.categories.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Cache stays within max_entries, dropping the stalest type"""
+        docs = {name: {"categories": [name]} for name in ("restaurant", "bar", "hotel")}
+        service = self._service(docs, max_entries=2)
+        
+        await service.get_categories("restaurant")
+        await service.get_categories("bar")
+        await service.get_categories("restaurant")
+        await service.get_categories("hotel")
+        
+        assert list(service.cache) == ["categories:restaurant", "categories:hotel"]
+    
+    @pytest.mark.asyncio
+    async def test_stats_count_categories_server_side(self):
+        """Stats come from a $size projection, not from the category arrays"""
+        service = self._service({"restaurant": {"categories": ["cuisine", "mood"]}, "bar": {}})
+        
+        assert await service.get_category_stats() == {"restaurant": 2, "bar": 0}
+        project = service.db.categories.pipeline[-1]["$project"]
+        assert "categories" not in project
+        assert project["count"] == {"$size": {"$ifNull": ["$categories", []]}}
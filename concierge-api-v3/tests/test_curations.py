@@ -340,3 +340,52 @@ def test_create_curation_denormalizes_city_type(client, test_db, clean_test_enti
     assert doc["city"] == "São Paulo"
     assert doc["type"] == "bar"
     test_db.curations.delete_one({"_id": "test_cur_denorm"})
+
+
+def test_score_concepts_matches_per_vector_cosine():
+    """Batched concept scoring agrees with per-vector cosine and skips unusable vectors"""
+    import numpy as np
+    from app.api.curations import score_concepts
+
+    query = np.asarray([1.0, 0.0, 1.0], dtype=np.float32)
+    embeddings = [
+        {"vector": [1.0, 0.0, 1.0], "category": "food"},
+        {"vector": [0.0, 2.0, 0.0], "category": "food"},
+        {"vector": [0.0, 0.0, 0.0], "category": "food"},   # zero norm
+        {"vector": [1.0, 1.0], "category": "food"},        # wrong dimensions
+        {"category": "food"},                               # no vector
+        {"vector": [1.0, 0.0, 0.0], "category": "drinks"},
+    ]
+
+    concepts, similarities = score_concepts(embeddings, query, float(np.linalg.norm(query)))
+    assert [c["vector"] for c in concepts] == [[1.0, 0.0, 1.0], [0.0, 2.0, 0.0], [1.0, 0.0, 0.0]]
+    assert np.allclose(similarities, [1.0, 0.0, 1 / np.sqrt(2)])
+
+    concepts, similarities = score_concepts(embeddings, query, float(np.linalg.norm(query)), {"drinks"})
+    assert [c["category"] for c in concepts] == ["drinks"]
+
+
+def test_entity_curations_are_serialized_by_alias():
+    """Entity curation listing is pre-serialized with the same JSON shape as response_model"""
+    import json
+    from unittest.mock import MagicMock
+    from app.api.curations import get_entity_curations
+
+    mock_db = MagicMock()
+    mock_db.entities.find_one.return_value = {"_id": "ent_1"}
+    mock_db.curations.find.return_value.limit.return_value = [{
+        "_id": "cur_1",
+        "curation_id": "cur_1",
+        "entity_id": "ent_1",
+        "curator_id": "u1",
+        "curator": {"id": "u1", "name": "Curator"},
+        "unstructured_text": "great pasta",
+    }]
+
+    response = get_entity_curations("ent_1", db=mock_db)
+    body = json.loads(response.body)
+
+    assert response.media_type == "application/json"
+    assert body[0]["_id"] == "cur_1"
+    assert body[0]["transcript"] == "great pasta"
+    assert body[0]["curator"] == {"id": "u1", "name": "Curator", "email": None}
@@ -0,0 +1,130 @@
+"""
+Test startup index creation without a live MongoDB
+"""
+from unittest.mock import MagicMock
+
+from pymongo.errors import OperationFailure
+
+from app.core import database
+
+
+def _index_names(collection):
+    """Names of the indexes passed to create_indexes on a mocked collection"""
+    return [index.document["name"] for call in collection.create_indexes.call_args_list for index in call.args[0]]
+
+
+class TestEnsureIndexes:
+    """Test _ensure_indexes against a mocked database"""
+
+    def test_collection_failure_does_not_skip_others(self, monkeypatch):
+        """A failing collection is logged and the other is still indexed"""
+        db = MagicMock()
+        db.entities.index_information.side_effect = RuntimeError("entities down")
+        db.curations.index_information.return_value = {}
+        monkeypatch.setattr(database, "_db", db)
+
+        database._ensure_indexes()
+
+        assert len(_index_names(db.curations)) == len(database.CURATION_INDEXES)
+
+    def test_existing_indexes_are_skipped(self, monkeypatch):
+        """Only indexes missing from index_information() are created"""
+        db = MagicMock()
+        db.entities.index_information.return_value = {
+            "_id_": {}, "type_1": {}, "name_1": {}, "createdAt_1": {}
+        }
+        db.curations.index_information.return_value = {}
+        monkeypatch.setattr(database, "_db", db)
+
+        database._ensure_indexes()
+
+        created = _index_names(db.entities)
+        assert "type_1" not in created
+        assert "name_text" in created
+        assert len(created) == len(database.ENTITY_INDEXES) - 3
+
+    def test_legacy_unique_entity_id_is_replaced(self, monkeypatch):
+        """Dropped legacy entity_id_1 is recreated as a non-unique index"""
+        db = MagicMock()
+        db.entities.index_information.return_value = {}
+        db.curations.index_information.return_value = {
+            "entity_id_1": {"key": [("entity_id", 1)], "unique": True}
+        }
+        monkeypatch.setattr(database, "_db", db)
+
+        database._ensure_indexes()
+
+        db.curations.database.command.assert_called_once_with(
+            "dropIndexes", db.curations.name, index=["entity_id_1"]
+        )
+        assert "entity_id_1" in _index_names(db.curations)
+        assert db.curations.create_indexes.call_count == 1
+
+    def test_conflicting_options_are_dropped_in_one_command(self):
+        """All conflicting indexes are dropped together and rebuilt in the batch"""
+        collection = MagicMock()
+        existing = {
+            "_id_": {"key": [("_id", 1)]},
+            "type_1": {"key": [("type", 1)], "unique": True},
+            "externalId_1": {"key": [("externalId", 1)]},
+            "name_1": {"key": [("name", 1)]},
+        }
+
+        created = database._create_missing_indexes(collection, database.ENTITY_INDEXES, existing)
+
+        collection.database.command.assert_called_once_with(
+            "dropIndexes", collection.name, index=["type_1", "externalId_1"]
+        )
+        assert created == len(database.ENTITY_INDEXES) - 1
+        assert collection.create_indexes.call_count == 1
+
+    def test_missing_indexes_are_created_in_one_command(self, monkeypatch):
+        """All missing indexes of a collection go in a single create_indexes call"""
+        db = MagicMock()
+        db.entities.index_information.return_value = {}
+        db.curations.index_information.return_value = {}
+        monkeypatch.setattr(database, "_db", db)
+
+        database._ensure_indexes()
+
+        assert db.entities.create_indexes.call_count == 1
+        assert db.curations.create_indexes.call_count == 1
+
+    def test_batch_failure_falls_back_to_single_indexes(self):
+        """A conflicting spec fails alone instead of blocking the whole batch"""
+        collection = MagicMock()
+
+        def create_indexes(indexes):
+            if len(indexes) > 1 or indexes[0].document["name"] == "externalId_1":
+                raise OperationFailure("conflict")
+
+        collection.create_indexes.side_effect = create_indexes
+
+        created = database._create_missing_indexes(collection, database.ENTITY_INDEXES, {})
+
+        assert created == len(database.ENTITY_INDEXES) - 1
+
+
+class TestIndexReadiness:
+    """Test the background index build readiness flag"""
+
+    def test_ready_after_background_build(self, monkeypatch):
+        """wait_for_indexes returns once the build thread has finished"""
+        import threading
+
+        built = []
+        monkeypatch.setattr(database, "_ensure_indexes", lambda: built.append(True))
+        thread = threading.Thread(target=database._build_indexes_then_set_ready)
+        monkeypatch.setattr(database, "_index_thread", thread)
+        database._indexes_ready.clear()
+
+        thread.start()
+
+        assert database.wait_for_indexes(timeout=5) is True
+        assert built == [True]
+
+    def test_no_wait_when_no_build_started(self, monkeypatch):
+        """Without a connection there is nothing to wait for"""
+        monkeypatch.setattr(database, "_index_thread", None)
+
+        assert database.wait_for_indexes(timeout=5) is False
@@ -0,0 +1,173 @@
+"""
+Test LLM Gateway response serialization without hitting MongoDB or Google Places
+"""
+import json
+
+from app.api.llm_gateway import (
+    get_manifest,
+    get_manifest_etag,
+    get_restaurant_bundle,
+    get_restaurant_snapshot,
+    get_tools,
+    get_tools_json,
+    search_restaurants,
+)
+from app.api.openai_compat import execute_function, get_available_functions, get_functions_listing
+from app.models.llm_tools import get_all_tools, get_restaurant_snapshot_tool, get_tools_manifest
+from app.models.llm_models import (
+    LLMGetRestaurantBundleRequest,
+    LLMGetRestaurantSnapshotRequest,
+    LLMRestaurantGeo,
+    LLMRestaurantSnapshot,
+    LLMSearchRestaurantItem,
+    LLMSearchRestaurantsRequest,
+)
+from app.services.llm_place_service import LLMPlaceService
+
+
+class FakeLLMPlaceService:
+    """Returns canned models instead of querying MongoDB / Google"""
+
+    def search_restaurants(self, **kwargs):
+        return [LLMSearchRestaurantItem(place_id="p1", name="Dom Manolo", geo=LLMRestaurantGeo(lat=1.0, lng=2.0))]
+
+    def get_restaurant_snapshot(self, **kwargs):
+        return LLMRestaurantSnapshot(name="Dom Manolo", place_id="p1"), ["google_places"]
+
+
+class CountingLLMPlaceService(FakeLLMPlaceService, LLMPlaceService):
+    """Real bundle/availability logic on top of the canned lookups"""
+
+    def __init__(self):
+        super().__init__(database=object())
+        self.snapshot_calls = 0
+
+    def get_restaurant_snapshot(self, **kwargs):
+        self.snapshot_calls += 1
+        return super().get_restaurant_snapshot(**kwargs)
+
+
+class TestGatewaySerialization:
+    """Test that gateway endpoints return pre-serialized JSON"""
+
+    def test_snapshot_response_keeps_null_fields(self):
+        """Snapshot JSON matches the response model, including null fields"""
+        response = get_restaurant_snapshot(
+            LLMGetRestaurantSnapshotRequest(place_id="p1"),
+            service=FakeLLMPlaceService()
+        )
+        body = json.loads(response.body)
+
+        assert response.media_type == "application/json"
+        assert body["snapshot"]["name"] == "Dom Manolo"
+        assert body["snapshot"]["geo"] is None
+        assert body["sources_used"] == ["google_places"]
+        assert body["metadata"]["timezone"] == "America/Sao_Paulo"
+
+    def test_search_response_includes_metadata(self):
+        """Search JSON carries items, count and search metadata"""
+        response = search_restaurants(
+            LLMSearchRestaurantsRequest(query="manolo"),
+            service=FakeLLMPlaceService()
+        )
+        body = json.loads(response.body)
+
+        assert body["total_results"] == 1
+        assert body["items"][0]["geo"] == {
+            "lat": 1.0, "lng": 2.0, "city": None, "state": None, "country": None, "postal_code": None
+        }
+        assert body["search_metadata"] == {"query": "manolo", "location_biased": False}
+
+    def test_function_call_results_have_legacy_shape(self):
+        """OpenAI-compatible function results keep their original top-level keys"""
+        service = FakeLLMPlaceService()
+
+        search = json.loads(execute_function("search_restaurants", {"query": "manolo"}, service))
+        snapshot = json.loads(execute_function("get_restaurant_snapshot", {"place_id": "p1"}, service))
+
+        assert set(search) == {"items", "total_results"}
+        assert set(snapshot) == {"snapshot", "sources_used"}
+        assert snapshot["snapshot"]["place_id"] == "p1"
+
+    def test_function_call_without_identifier_is_rejected_early(self):
+        """Place functions need place_id or entity_id before the service is touched"""
+        for name in ("get_restaurant_snapshot", "get_restaurant_availability", "get_restaurant_photos"):
+            result = json.loads(execute_function(name, {"place_id": ""}, service=None))
+            assert result == {"error": "place_id or entity_id parameter is required"}
+
+    def test_bundle_builds_snapshot_once(self):
+        """Bundle returns search, snapshot and availability from one snapshot build"""
+        service = CountingLLMPlaceService()
+        response = get_restaurant_bundle(LLMGetRestaurantBundleRequest(query="manolo"), service=service)
+        body = json.loads(response.body)
+
+        assert service.snapshot_calls == 1
+        assert body["total_results"] == 1
+        assert body["snapshot"]["place_id"] == "p1"
+        assert body["availability"]["resolved_place_id"] == "p1"
+        assert body["sources_used"] == ["google_places"]
+
+    def test_bundle_sections_can_be_skipped(self):
+        """Disabling both sections skips the snapshot lookup"""
+        service = CountingLLMPlaceService()
+        request = LLMGetRestaurantBundleRequest(query="manolo", include_snapshot=False, include_availability=False)
+        body = json.loads(get_restaurant_bundle(request, service=service).body)
+
+        assert service.snapshot_calls == 0
+        assert body["snapshot"] is None and body["availability"] is None
+
+
+class TestToolSchemas:
+    """Test MCP tool schema accessors"""
+
+    def test_schemas_are_built_once(self):
+        """Repeat calls return the same cached objects"""
+        assert get_all_tools() is get_all_tools()
+        assert get_all_tools()[1] is get_restaurant_snapshot_tool()
+        assert get_tools_manifest()["tools"] is get_all_tools()
+
+    def test_manifest_counts_tools(self):
+        """Manifest tool_count matches the tool list"""
+        manifest = get_tools_manifest()
+        assert manifest["metadata"]["tool_count"] == len(manifest["tools"]) == 4
+
+    def test_tool_endpoints_serve_cached_json(self):
+        """Tool endpoints return the pre-encoded schemas unchanged"""
+        assert get_tools(verbose=False, if_none_match=None).body is get_tools(verbose=False, if_none_match=None).body
+        assert json.loads(get_tools(verbose=False, if_none_match=None).body) == {"tools": get_all_tools()}
+        assert json.loads(get_manifest(if_none_match=None).body) == get_tools_manifest()
+
+    def test_tool_endpoints_revalidate_with_etag(self):
+        """A matching If-None-Match gets an empty 304, a stale one the full body"""
+        etag = get_tools(verbose=False, if_none_match=None).headers["etag"]
+
+        cached = get_tools(verbose=False, if_none_match=etag)
+        stale = get_tools(verbose=False, if_none_match='"stale"')
+
+        assert cached.status_code == 304 and cached.body == b""
+        assert cached.headers["etag"] == etag
+        assert stale.status_code == 200 and stale.body == get_tools_json()
+        assert get_manifest(if_none_match=f'"stale", W/{get_manifest_etag()}').status_code == 304
+
+    def test_verbose_tools_add_examples(self):
+        """Verbose listing extends the short descriptions and keeps the schemas"""
+        short, verbose = get_all_tools(), get_all_tools(verbose=True)
+
+        for brief, full in zip(short, verbose):
+            assert full["description"].startswith(brief["description"])
+            assert "Example use cases" in full["description"]
+            assert "Example use cases" not in brief["description"]
+            assert full["inputSchema"] is brief["inputSchema"]
+
+        body = json.loads(get_tools(verbose=True, if_none_match=None).body)
+        assert body == {"tools": verbose}
+
+    def test_openai_function_definitions_are_cached(self):
+        """OpenAI-format functions are built once and listed from the same models"""
+        assert get_available_functions() is get_available_functions()
+
+        listing = get_functions_listing()
+        assert listing["count"] == len(get_available_functions())
+        assert [f["name"] for f in listing["functions"]] == [
+            tool.function.name for tool in get_available_functions()
+        ]
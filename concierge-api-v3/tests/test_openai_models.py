@@ -0,0 +1,131 @@
+"""
+Test OpenAI-compatible request/response models
+"""
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.openai_models import CHAT_MESSAGES_ADAPTER, ChatCompletionRequest, ToolChoiceFunction
+
+
+def _request(**overrides):
+    payload = {"model": "concierge-restaurant", "messages": [{"role": "user", "content": "hi"}]}
+    payload.update(overrides)
+    return ChatCompletionRequest.model_validate(payload)
+
+
+class TestToolChoice:
+    """Test tool_choice validation"""
+
+    @pytest.mark.parametrize("mode", ["auto", "required", "none"])
+    def test_mode_strings_are_accepted(self, mode):
+        """Bare mode strings validate as-is"""
+        assert _request(tool_choice=mode).tool_choice == mode
+
+    def test_function_object_is_accepted(self):
+        """A function object validates to ToolChoiceFunction"""
+        choice = _request(tool_choice={"type": "function", "name": "search_restaurants"}).tool_choice
+        assert choice == ToolChoiceFunction(name="search_restaurants")
+
+    def test_default_and_null(self):
+        """tool_choice defaults to auto and still accepts null"""
+        assert _request().tool_choice == "auto"
+        assert _request(tool_choice=None).tool_choice is None
+
+    def test_unknown_mode_is_rejected(self):
+        """Strings outside the known modes fail validation"""
+        with pytest.raises(ValidationError):
+            _request(tool_choice="always")
+
+
+class TestModelConfig:
+    """Test shared config of the OpenAI-compatible models"""
+
+    def test_unknown_openai_params_are_ignored(self):
+        """Params we do not implement (top_p, seed, ...) are dropped"""
+        request = _request(top_p=0.9, seed=42)
+        assert "top_p" not in request.model_dump()
+
+    def test_messages_are_immutable(self):
+        """Validated messages cannot be modified in place"""
+        request = _request()
+        with pytest.raises(ValidationError):
+            request.messages[0].content = "changed"
+
+    def test_literal_values_are_shared(self):
+        """Literal fields validated from JSON reuse one string object per value"""
+        body = b'{"model": "m", "messages": [{"role": "user"}, {"role": "user"}]}'
+        first, second = ChatCompletionRequest.model_validate_json(body).messages
+        assert first.role is second.role
+
+    def test_messages_adapter_round_trips(self):
+        """The list adapter dumps a conversation that validates back unchanged"""
+        messages = _request().messages
+        assert CHAT_MESSAGES_ADAPTER.validate_json(CHAT_MESSAGES_ADAPTER.dump_json(messages)) == messages
+
+
+class TestRequestParsing:
+    """Test chat completion body parsing from raw JSON"""
+
+    @staticmethod
+    def _http_request(body: bytes):
+        from starlette.requests import Request
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+    @pytest.mark.asyncio
+    async def test_valid_body_is_parsed(self):
+        """JSON bytes validate straight into ChatCompletionRequest"""
+        from app.api.openai_compat import parse_chat_request
+
+        body = b'{"model": "concierge-restaurant", "messages": [{"role": "user", "content": "hi"}]}'
+        request = await parse_chat_request(self._http_request(body))
+        assert request.messages[0].content == "hi"
+
+    @pytest.mark.asyncio
+    async def test_invalid_body_keeps_fastapi_error_shape(self):
+        """Validation errors surface as RequestValidationError with body-prefixed locs"""
+        from fastapi.exceptions import RequestValidationError
+        from app.api.openai_compat import parse_chat_request
+
+        with pytest.raises(RequestValidationError) as exc:
+            await parse_chat_request(self._http_request(b'{"messages": []}'))
+        assert exc.value.errors()[0]["loc"] == ("body", "model")
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_response_serializes(self):
+        """Server-built (unvalidated) responses still dump to the OpenAI shape"""
+        from app.api.openai_compat import chat_completions
+
+        body = b'{"model": "concierge-restaurant", "messages": [{"role": "user", "content": "hi"}]}'
+        response = await chat_completions(self._http_request(body), auth={}, service=None)
+        dumped = json.loads(response.body)
+
+        assert response.media_type == "application/json"
+
+        assert dumped["object"] == "chat.completion"
+        assert dumped["choices"][0]["finish_reason"] == "stop"
+        assert dumped["choices"][0]["message"]["role"] == "assistant"
+        assert dumped["usage"]["total_tokens"] > dumped["usage"]["prompt_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_share_created(self):
+        """All chunks of a streamed completion carry one created timestamp"""
+        from app.api.openai_compat import _stream_tool_results
+
+        calls = [{"call_id": "c1", "function_name": "f", "result": "{}"}]
+        chunks = [chunk async for chunk in _stream_tool_results("id", "m", calls, [])]
+        created = {json.loads(chunk[len("data: "):])["created"] for chunk in chunks[:-1]}
+
+        assert len(chunks) == 4
+        assert len(created) == 1
+
+    def test_documented_schema_has_no_refs(self):
+        """OpenAPI body schema is fully inlined"""
+        from app.api.openai_compat import CHAT_REQUEST_OPENAPI
+
+        assert "$ref" not in str(CHAT_REQUEST_OPENAPI)
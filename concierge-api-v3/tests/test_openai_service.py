@@ -0,0 +1,33 @@
+"""
+Test OpenAIService helpers that don't call OpenAI
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.openai_config_service import OpenAIConfigService
+from app.services.openai_service import normalize_language_code
+
+
+@pytest.mark.parametrize("language, expected", [
+    ("pt-BR", "pt"),
+    ("EN", "en"),
+    ("es", "es"),
+    ("portuguese", None),
+    ("p1", None),
+    ("çã", None),
+])
+def test_normalize_language_code(language, expected):
+    """Locales reduce to ISO-639-1; anything else is rejected"""
+    assert normalize_language_code(language) == expected
+
+
+def test_render_prompt_joins_category_tuples():
+    """Cached category tuples render the same as lists"""
+    db = MagicMock()
+    db.openai_configs.find_one.return_value = {"prompt_template": "Use: {categories}. Text: {text}"}
+    service = OpenAIConfigService(db)
+
+    prompt = service.render_prompt("image_analysis", {"categories": ("cuisine", "mood"), "text": "ok"})
+
+    assert prompt == "Use: cuisine, mood. Text: ok"
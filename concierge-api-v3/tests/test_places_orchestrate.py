@@ -0,0 +1,148 @@
+"""
+Test Places orchestration helpers without hitting Google Places
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import places_orchestrate
+from app.api.places_orchestrate import (
+    PlacesOrchestrationRequest,
+    call_bulk_multi_operations,
+    determine_operation,
+    orchestrate_places_request,
+    places_cache,
+)
+
+
+class TestBulkMultiOperations:
+    """Test parallel fan-out of bulk multi-operations"""
+
+    @pytest.mark.asyncio
+    async def test_operations_run_concurrently_within_limit(self, monkeypatch):
+        """Operations overlap but never exceed places_max_concurrency"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_text_search(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"places": [{"id": request.query}]}
+
+        monkeypatch.setattr(places_orchestrate, "call_text_search", fake_text_search)
+        monkeypatch.setattr(places_orchestrate.settings, "places_max_concurrency", 3)
+
+        operations = [{"query": f"q{i}"} for i in range(8)]
+        data = await call_bulk_multi_operations(operations, PlacesOrchestrationRequest())
+
+        assert peak == 3
+        assert [place["id"] for place in data["places"]] == [f"q{i}" for i in range(8)]
+        assert data["operations_executed"] == ["text_search"] * 8
+        assert data["total_errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_is_reported_per_item(self, monkeypatch):
+        """One failing operation does not discard the others"""
+
+        async def fake_place_details(request):
+            if request.place_id == "bad":
+                raise RuntimeError("boom")
+            return {"id": request.place_id}
+
+        monkeypatch.setattr(places_orchestrate, "call_place_details", fake_place_details)
+
+        operations = [{"place_id": "good"}, {"place_id": "bad"}]
+        data = await call_bulk_multi_operations(operations, PlacesOrchestrationRequest())
+
+        assert data["places"] == [{"id": "good"}]
+        assert data["errors"] == [{"operation": {"place_id": "bad"}, "error": "boom"}]
+        assert data["total_success"] == 1
+
+
+class TestOrchestrationCache:
+    """Test response caching in the orchestration endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_is_served_from_cache(self, monkeypatch):
+        """Second identical request does not call Google Places"""
+        calls = 0
+
+        async def fake_text_search(request):
+            nonlocal calls
+            calls += 1
+            return {"places": [{"id": "p1"}]}
+
+        monkeypatch.setattr(places_orchestrate, "call_text_search", fake_text_search)
+        places_cache.clear_cache()
+
+        first = await orchestrate_places_request(PlacesOrchestrationRequest(query="pizza"))
+        second = await orchestrate_places_request(PlacesOrchestrationRequest(query="pizza"))
+
+        assert calls == 1
+        assert second.body == first.body
+        assert json.loads(second.body)["results"] == [{"id": "p1"}]
+
+    @pytest.mark.asyncio
+    async def test_paginated_response_is_not_cached(self, monkeypatch):
+        """Responses with a next_page_token are always fetched fresh"""
+        calls = 0
+
+        async def fake_text_search(request):
+            nonlocal calls
+            calls += 1
+            return {"places": [], "nextPageToken": "token"}
+
+        monkeypatch.setattr(places_orchestrate, "call_text_search", fake_text_search)
+        places_cache.clear_cache()
+
+        await orchestrate_places_request(PlacesOrchestrationRequest(query="sushi"))
+        await orchestrate_places_request(PlacesOrchestrationRequest(query="sushi"))
+
+        assert calls == 2
+
+
+class TestOperationDispatch:
+    """Test operation routing in the orchestration endpoint"""
+
+    @pytest.mark.parametrize("params, expected", [
+        ({"operations": [{"query": "a"}], "place_ids": ["p1"], "query": "a"}, "bulk_multi"),
+        ({"place_ids": ["p1"], "place_id": "p2", "query": "a"}, "bulk_details"),
+        ({"place_id": "p1", "query": "a", "latitude": 1.0, "longitude": 2.0}, "details"),
+        ({"query": "a", "latitude": 1.0, "longitude": 2.0}, "text_search"),
+        ({"latitude": 1.0, "longitude": 2.0}, "nearby"),
+        ({}, "autocomplete"),
+    ])
+    def test_operation_precedence(self, params, expected):
+        """Fields are checked in precedence order when several are set"""
+        assert determine_operation(PlacesOrchestrationRequest(**params)) == expected
+
+    @pytest.mark.asyncio
+    async def test_details_result_is_wrapped_in_list(self, monkeypatch):
+        """Details operation returns its single place as a one-item list"""
+
+        async def fake_place_details(request):
+            return {"id": request.place_id}
+
+        monkeypatch.setattr(places_orchestrate, "call_place_details", fake_place_details)
+        places_cache.clear_cache()
+
+        response = await orchestrate_places_request(PlacesOrchestrationRequest(place_id="abc"))
+        body = json.loads(response.body)
+
+        assert body["operation"] == "details"
+        assert body["results"] == [{"id": "abc"}]
+
+    @pytest.mark.asyncio
+    async def test_unroutable_request_is_rejected(self):
+        """A request with no usable parameters returns 400"""
+        places_cache.clear_cache()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await orchestrate_places_request(PlacesOrchestrationRequest())
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from app.services.request_coalescer import RequestCoalescer, request_fingerprint
+
+
+def test_fingerprint_ignores_key_order():
+    assert request_fingerprint("details", {"a": 1, "b": 2}) == request_fingerprint("details", {"b": 2, "a": 1})
+    assert request_fingerprint("details", {"a": 1}) != request_fingerprint("text_search", {"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": "place"}
+
+    results = await asyncio.gather(*(coalescer.get_or_create("key", fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [{"id": "place"}] * 5
+    assert coalescer.in_flight_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_and_are_not_cached():
+    coalescer = RequestCoalescer()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await coalescer.get_or_create("key", fail)
+
+    async def succeed():
+        return "ok"
+
+    assert await coalescer.get_or_create("key", succeed) == "ok"
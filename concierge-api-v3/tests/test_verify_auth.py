@@ -24,6 +24,14 @@ class TestVerifyAuth:
             verify_auth(api_key="bad-key", bearer=None)
         assert exc.value.status_code == 401
 
+    def test_non_ascii_api_key_is_rejected_not_500(self):
+        """Non-ASCII API key fails the comparison instead of raising TypeError."""
+        from app.core.security import verify_auth
+
+        with pytest.raises(HTTPException) as exc:
+            verify_auth(api_key="clé-invalide", bearer=None)
+        assert exc.value.status_code == 401
+
     def test_no_credentials_raises_401(self):
         """Neither API key nor bearer raises 401."""
         from app.core.security import verify_auth
@@ -100,3 +108,87 @@ class TestVerifyAuth:
                 verify_auth(api_key=None, bearer=creds)
             assert exc.value.status_code == 500
             assert "not configured" in str(exc.value.detail)
+
+    def test_rotated_secret_applies_after_reload(self, monkeypatch):
+        """Cached secret key is only re-read after reload_secret()."""
+        from app.core.security import verify_auth, reload_secret
+        from app.core.config import settings
+
+        original = settings.api_secret_key
+        reload_secret()
+        verify_auth(api_key=original, bearer=None)
+
+        monkeypatch.setattr(settings, "api_secret_key", "rotated-key")
+        with pytest.raises(HTTPException):
+            verify_auth(api_key="rotated-key", bearer=None)
+
+        reload_secret()
+        try:
+            result = verify_auth(api_key="rotated-key", bearer=None)
+            assert result["method"] == "api_key"
+        finally:
+            monkeypatch.setattr(settings, "api_secret_key", original)
+            reload_secret()
+
+
+class TestTokenExpiry:
+    """Test expiry handling in verify_access_token / verify_refresh_token."""
+
+    @pytest.mark.asyncio
+    async def test_expired_access_token_raises_401(self, monkeypatch):
+        """Expired access token is rejected with a specific message."""
+        from datetime import timedelta
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core.security import create_access_token, verify_access_token
+
+        monkeypatch.delenv("TESTING", raising=False)
+        token = create_access_token(data={"sub": "old@example.com"}, expires_delta=timedelta(seconds=-1))
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with pytest.raises(HTTPException) as exc:
+            await verify_access_token(credentials=creds)
+        assert exc.value.status_code == 401
+        assert exc.value.detail == "Token expired"
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_round_trip(self):
+        """Fresh refresh token verifies and keeps its type claim."""
+        from app.core.security import create_refresh_token, verify_refresh_token
+
+        payload = await verify_refresh_token(create_refresh_token(data={"sub": "user@example.com"}))
+        assert payload["sub"] == "user@example.com"
+        assert payload["type"] == "refresh"
+        assert payload["exp"] - payload["iat"] == 30 * 24 * 3600
+
+    @pytest.mark.asyncio
+    async def test_access_token_decode_is_cached(self, monkeypatch):
+        """Repeat verification of the same token skips jwt.decode."""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import security
+
+        monkeypatch.delenv("TESTING", raising=False)
+        security.reload_secret()
+        token = security.create_access_token(data={"sub": "cached@example.com"})
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        first = await security.verify_access_token(credentials=creds)
+        with patch("app.core.security.jwt.decode", side_effect=AssertionError("decoded twice")):
+            second = await security.verify_access_token(credentials=creds)
+
+        assert second == first
+        security.reload_secret()
+
+    @pytest.mark.asyncio
+    async def test_access_token_claims_are_epoch_ints(self, monkeypatch):
+        """exp/iat are written as integer epoch seconds."""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core.security import create_access_token, verify_access_token
+
+        monkeypatch.delenv("TESTING", raising=False)
+        token = create_access_token(data={"sub": "epoch@example.com"})
+        payload = await verify_access_token(
+            credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+
+        assert isinstance(payload["exp"], int) and isinstance(payload["iat"], int)
+        assert payload["exp"] - payload["iat"] == 60 * 60